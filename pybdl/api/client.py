@@ -1,8 +1,23 @@
 import asyncio
+import functools
+import itertools
+import threading
 import time
 import warnings
-from collections.abc import AsyncIterator, Iterator, Mapping
-from typing import Any, Literal, cast, overload
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Literal, TypeVar, cast, overload
 
 import httpx
 from tqdm import tqdm
@@ -10,18 +25,40 @@ from tqdm import tqdm
 from pybdl.api.exceptions import BDLHTTPError, BDLQuotaDesyncWarning, BDLResponseError
 from pybdl.config import BDL_API_BASE_URL, DEFAULT_QUOTAS, BDLConfig, QuotaMap
 from pybdl.utils.http_cache import (
-    build_async_http_client,
-    build_sync_http_client,
+    ConditionalRequestCache,
+    DecodedResponseCache,
+    acquire_shared_async_http_client,
+    acquire_shared_sync_http_client,
+    connection_limits,
+    forget_shared_async_http_client,
     is_from_http_cache,
+    release_shared_async_http_client,
+    release_shared_sync_http_client,
     resolve_http_cache_db_path,
 )
+from pybdl.utils.jsonlib import loads as json_loads
 from pybdl.utils.rate_limiter import AsyncRateLimiter, PersistentQuotaCache, RateLimiter
 
+_KeyT = TypeVar("_KeyT")
+_ResultT = TypeVar("_ResultT")
+
 # Centralized type literals for API parameters
 LanguageLiteral = Literal["pl", "en"]
 FormatLiteral = Literal["json", "jsonapi", "xml"]
 AcceptHeaderLiteral = Literal["application/json", "application/vnd.api+json", "application/xml"]
 
+_FORMAT_TO_ACCEPT: dict[str, AcceptHeaderLiteral] = {
+    "json": "application/json",
+    "jsonapi": "application/vnd.api+json",
+    "xml": "application/xml",
+}
+
+# Transport failures raised before the request reached the API, so no quota was spent.
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.ProxyError)
+
+# Pagination fields dropped from response metadata, in addition to the results key itself.
+_METADATA_EXCLUDED_KEYS = frozenset({"page", "pageSize", "links"})
+
 
 class BaseAPIClient:
     """Base client for BDL API interactions with both sync and async support.
@@ -42,12 +79,19 @@ class BaseAPIClient:
             extra_headers: Optional extra headers (e.g., Accept-Language) to include in requests.
         """
         self.config = config
+        # Resolved once: the config is not expected to change after the client is built.
+        self._default_lang = cast(LanguageLiteral, getattr(config.language, "value", config.language))
+        self._default_format = cast(FormatLiteral, getattr(config.format, "value", config.format))
+        # Query params and headers for the default language and format; copied per call, never mutated.
+        self._base_params, self._base_headers = self._language_params_and_headers(
+            self._default_lang, self._default_format
+        )
         is_registered = bool(config.api_key)
         quotas: QuotaMap = cast(
             QuotaMap,
             config.custom_quotas if config.custom_quotas is not None else DEFAULT_QUOTAS,
         )
-        self._quota_cache = PersistentQuotaCache(
+        self._quota_cache = PersistentQuotaCache.shared(
             config.quota_cache_enabled,
             cache_file=config.quota_cache_file,
             use_global_cache=config.use_global_cache,
@@ -66,19 +110,35 @@ class BaseAPIClient:
         )
         self._proxy_url = self._build_proxy_url()
         self._http_cache_path = resolve_http_cache_db_path(config.cache_backend, self._quota_cache.cache_file)
-        default_headers = self._build_default_headers(extra_headers)
-        self.session = build_sync_http_client(
-            cache_backend=config.cache_backend,
-            http_cache_db_path=self._http_cache_path,
-            default_headers=default_headers,
-            proxy=self._proxy_url,
+        self._default_headers = self._build_default_headers(extra_headers)
+        self._cache_ttl = float(config.cache_expire_after)
+        self._decoded_cache = DecodedResponseCache()
+        # hishel revalidates its own entries; without it, remember validators per URL instead.
+        self._conditional_cache = (
+            ConditionalRequestCache(config.conditional_cache_size)
+            if config.cache_backend is None and config.conditional_cache_size > 0
+            else None
         )
-        self._async_client = build_async_http_client(
+        self._connection_limits = connection_limits(config.max_connections, config.max_keepalive_connections)
+        # Clients with identical settings share one sync HTTP client, its connection pool and cache.
+        self.session = acquire_shared_sync_http_client(
             cache_backend=config.cache_backend,
             http_cache_db_path=self._http_cache_path,
-            default_headers=default_headers,
+            default_headers=self._default_headers,
             proxy=self._proxy_url,
+            cache_ttl=self._cache_ttl,
+            limits=self._connection_limits,
         )
+        self._session_released = False
+        # Snapshot of the session's default headers; they are not mutated after construction.
+        self._session_headers: dict[str, str] = dict(self.session.headers.items())
+        self._async_http_client: httpx.AsyncClient | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[tuple[Any, ...], asyncio.Task[dict[str, Any]]] = {}
+        self._inflight_sync: dict[tuple[Any, ...], Future[dict[str, Any]]] = {}
+        self._inflight_sync_lock = threading.Lock()
+        # (endpoint, lang, format) -> (monotonic time stored, payload) for */metadata endpoints.
+        self._metadata_cache: dict[tuple[str, str | None, str | None], tuple[float, dict[str, Any]]] = {}
 
     def _build_proxy_url(self) -> str | None:
         if not self.config.proxy_url:
@@ -100,14 +160,51 @@ class BaseAPIClient:
             headers.update({key: str(value) for key, value in extra_headers.items() if value is not None})
         return headers
 
+    @property
+    def _async_client(self) -> httpx.AsyncClient:
+        """
+        Pooled async HTTP client, created on first use and reused for every async request.
+
+        API clients with identical settings on the same event loop share one client. When the
+        client is used from a new event loop (e.g. a second ``asyncio.run``), a client for that
+        loop is acquired, since connections cannot outlive the loop that opened them.
+        """
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._async_http_client is not None and self._async_client_loop is not loop:
+            forget_shared_async_http_client(self._async_http_client)
+            self._async_http_client = None
+        if self._async_http_client is None:
+            self._async_client_loop = loop
+            self._async_http_client = acquire_shared_async_http_client(
+                cache_backend=self.config.cache_backend,
+                http_cache_db_path=self._http_cache_path,
+                default_headers=self._default_headers,
+                proxy=self._proxy_url,
+                cache_ttl=self._cache_ttl,
+                limits=self._connection_limits,
+            )
+        return self._async_http_client
+
     def close(self) -> None:
-        """Close synchronous HTTP resources."""
-        self.session.close()
+        """Release synchronous HTTP resources; the shared session closes with its last holder."""
+        if not self._session_released:
+            self._session_released = True
+            release_shared_sync_http_client(self.session)
+        self.clear_metadata_cache()
+
+    def clear_metadata_cache(self) -> None:
+        """Forget metadata responses kept for ``config.metadata_cache_ttl``, so the next call requests them."""
+        self._metadata_cache.clear()
 
     async def aclose(self) -> None:
         """Close synchronous and asynchronous HTTP resources."""
         self.close()
-        await self._async_client.aclose()
+        if self._async_http_client is not None:
+            client, self._async_http_client = self._async_http_client, None
+            await release_shared_async_http_client(client)
 
     def __enter__(self) -> "BaseAPIClient":
         return self
@@ -136,12 +233,36 @@ class BaseAPIClient:
         """
         if format is None:
             return None
-        format_to_accept = {
-            "json": "application/json",
-            "jsonapi": "application/vnd.api+json",
-            "xml": "application/xml",
-        }
-        return format_to_accept.get(format)
+        return _FORMAT_TO_ACCEPT.get(format)
+
+    @staticmethod
+    def _language_params_and_headers(
+        lang: LanguageLiteral | None, format: FormatLiteral | None
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Return new query params and headers selecting a response language and format."""
+        params: dict[str, Any] = {}
+        headers: dict[str, str] = {}
+        if lang:
+            params["lang"] = lang
+            headers["Accept-Language"] = lang
+        if format:
+            params["format"] = format
+        accept_header = BaseAPIClient._format_to_accept_header(format)
+        if accept_header:
+            headers["Accept"] = accept_header
+        return params, headers
+
+    @staticmethod
+    def _is_unset(value: Any) -> bool:
+        return value is None or (isinstance(value, (str, list, tuple)) and not value)
+
+    @staticmethod
+    def _assemble_params(params: dict[str, Any], extra_query: dict[str, Any] | None) -> dict[str, Any]:
+        """Drop unset (None or empty) query parameters in one pass and apply ``extra_query`` on top."""
+        assembled = {key: value for key, value in params.items() if not BaseAPIClient._is_unset(value)}
+        if extra_query:
+            assembled.update(extra_query)
+        return assembled
 
     def _prepare_api_params_and_headers(
         self,
@@ -164,30 +285,16 @@ class BaseAPIClient:
         Returns:
             Tuple of (params dict, headers dict).
         """
-        # Set defaults from config
-        if lang is None:
-            lang_val = self.config.language.value if hasattr(self.config.language, "value") else self.config.language
-            lang = lang_val if isinstance(lang_val, str) else lang_val.value  # type: ignore[assignment]
-        if format is None:
-            format_val = self.config.format.value if hasattr(self.config.format, "value") else self.config.format
-            format = format_val if isinstance(format_val, str) else format_val.value  # type: ignore[assignment]
-
-        params: dict[str, Any] = {}
-        if lang:
-            params["lang"] = lang
-        if format:
-            params["format"] = format
-        if extra_params:
-            params.update(extra_params)
+        if (lang is None or lang == self._default_lang) and (format is None or format == self._default_format):
+            params = {**self._base_params, **extra_params} if extra_params else dict(self._base_params)
+            headers = dict(self._base_headers)
+        else:
+            base_params, headers = self._language_params_and_headers(
+                self._default_lang if lang is None else lang,
+                self._default_format if format is None else format,
+            )
+            params = {**base_params, **extra_params} if extra_params else base_params
 
-        headers: dict[str, str] = {}
-        # Set Accept-Language header from lang parameter
-        if lang:
-            headers["Accept-Language"] = lang
-        # Set Accept header from format parameter
-        accept_header = BaseAPIClient._format_to_accept_header(format)
-        if accept_header:
-            headers["Accept"] = accept_header
         if if_none_match:
             headers["If-None-Match"] = if_none_match
         if if_modified_since:
@@ -195,6 +302,14 @@ class BaseAPIClient:
 
         return params, headers
 
+    def _build_query(self, params: Mapping[str, Any] | None, page_size: int | None = None) -> dict[str, Any]:
+        """Return a new query dict with the default language and, if given, the page size applied."""
+        lang = self._default_lang
+        query: dict[str, Any] = {**params, "lang": params.get("lang", lang)} if params else {"lang": lang}
+        if page_size is not None:
+            query["page-size"] = page_size
+        return query
+
     def _build_url(self, endpoint: str) -> str:
         """
         Build the full API URL for a given endpoint.
@@ -208,25 +323,72 @@ class BaseAPIClient:
         endpoint = endpoint.strip("/")
         return f"{BDL_API_BASE_URL}/{endpoint}"
 
+    @staticmethod
+    def _total_pages(first_page: Mapping[str, Any], page_size: int, max_pages: int | None) -> int | None:
+        """
+        Return how many pages a paginated listing spans, based on the first page's record count.
+
+        Returns None when the response carries no record count.
+        """
+        total = first_page.get("totalRecords", first_page.get("totalCount"))
+        if not isinstance(total, int):
+            return None
+        total_pages = -(-total // page_size)
+        return min(total_pages, max_pages) if max_pages else total_pages
+
     @staticmethod
     def _metadata_from_response(data: dict[str, Any], results_key: str) -> dict[str, Any]:
-        return {key: value for key, value in data.items() if key not in {results_key, "page", "pageSize", "links"}}
+        return {key: value for key, value in data.items() if key != results_key and key not in _METADATA_EXCLUDED_KEYS}
 
     def _merge_headers(self, headers: Mapping[str, str] | None = None) -> dict[str, str]:
-        request_headers = {key: str(value) for key, value in self.session.headers.items()}
-        if headers:
-            request_headers.update({key: str(value) for key, value in headers.items()})
-        return request_headers
+        """Return the session headers merged with per-call headers; the result must not be mutated."""
+        if not headers:
+            return self._session_headers
+        return {**self._session_headers, **{key: str(value) for key, value in headers.items()}}
+
+    @staticmethod
+    def _request_key(
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str],
+    ) -> tuple[Any, ...]:
+        """Build a hashable identity for a request, used to coalesce identical in-flight calls."""
+        frozen_params = tuple(
+            sorted((key, tuple(value) if isinstance(value, list) else value) for key, value in (params or {}).items())
+        )
+        return method.upper(), url, frozen_params, tuple(sorted(headers.items()))
+
+    def _conditional_headers(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> dict[str, str]:
+        """Add stored validators to a GET request unless the caller set its own."""
+        if self._conditional_cache is None or method.upper() != "GET":
+            return headers
+        if any(key.lower() in ("if-none-match", "if-modified-since") for key in headers):
+            return headers
+        validators = self._conditional_cache.validators(httpx.URL(url).copy_merge_params(params or {}))
+        return {**headers, **validators} if validators else headers
 
     def _extract_error_detail(self, response: httpx.Response) -> Any:
+        content_type = response.headers.get("Content-Type")
+        if content_type is not None:
+            media_type = content_type.partition(";")[0].strip().lower()
+            if not (media_type.endswith("/json") or media_type.endswith("+json")):
+                # HTML error pages from proxies or gateways are returned as text without a parse attempt.
+                return response.text
         try:
-            return response.json()
+            return json_loads(response.content)
         except Exception:
             return response.text
 
     def _parse_response_json(self, response: httpx.Response) -> dict[str, Any]:
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except Exception as exc:
             raise BDLResponseError("Received a non-JSON response from the BDL API.", payload=response.text) from exc
         if not isinstance(data, dict):
@@ -236,6 +398,10 @@ class BaseAPIClient:
         return data
 
     def _process_response(self, response: httpx.Response) -> dict[str, Any]:
+        if response.status_code == 304 and self._conditional_cache is not None:
+            not_modified = self._conditional_cache.get(response)
+            if not_modified is not None:
+                return not_modified
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -244,7 +410,22 @@ class BaseAPIClient:
                 response_body=self._extract_error_detail(response),
                 url=str(response.url),
             ) from exc
-        return self._parse_response_json(response)
+        data = self._decoded_cache.get(response)
+        if data is None:
+            data = self._parse_response_json(response)
+            self._decoded_cache.put(response, data)
+        if self._conditional_cache is not None:
+            self._conditional_cache.put(response, data)
+        return data
+
+    @staticmethod
+    def _transport_error(exc: httpx.HTTPError, url: str) -> BDLHTTPError:
+        """Wrap an httpx error raised before any response was processed."""
+        return BDLHTTPError(
+            status_code=getattr(getattr(exc, "response", None), "status_code", None),
+            response_body=str(exc),
+            url=url,
+        )
 
     def _should_retry_status(self, status_code: int) -> bool:
         return status_code in self.config.retry_status_codes
@@ -288,37 +469,85 @@ class BaseAPIClient:
         method: str = "GET",
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        reservation: float | None = None,
     ) -> dict[str, Any]:
-        query = params.copy() if params else None
-        lang = self.config.language.value if hasattr(self.config.language, "value") else self.config.language
-        if params is not None or "?" not in url:
-            query = query or {}
-            query.setdefault("lang", lang)
-        request_headers = self._merge_headers(headers)
+        """
+        Make a single HTTP request to a full URL (sync).
+
+        Identical concurrent GET requests from different threads are coalesced: only the
+        first caller issues the HTTP request and the others wait for its result, so they all
+        receive the same decoded payload object.
+
+        ``reservation`` is a quota slot already taken with ``acquire_many``; it is used for
+        the first attempt instead of acquiring a new one.
+        """
+        # A full ``links.next`` URL already carries its query string.
+        query = self._build_query(params) if params is not None or "?" not in url else None
+        request_headers = self._conditional_headers(method, url, query, self._merge_headers(headers))
 
+        if method.upper() != "GET":
+            return self._send_sync_request(
+                url, method=method, query=query, request_headers=request_headers, reservation=reservation
+            )
+
+        key = self._request_key(method, url, query, request_headers)
+        with self._inflight_sync_lock:
+            pending = self._inflight_sync.get(key)
+            if pending is None:
+                future: Future[dict[str, Any]] = Future()
+                self._inflight_sync[key] = future
+        if pending is not None:
+            if reservation is not None:
+                # The request is already in flight, so the slot reserved for it is not needed.
+                self._sync_limiter.release(reservation)
+            return pending.result()
+
+        try:
+            result = self._send_sync_request(
+                url, method=method, query=query, request_headers=request_headers, reservation=reservation
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_sync_lock:
+                del self._inflight_sync[key]
+
+    def _send_sync_request(
+        self,
+        url: str,
+        *,
+        method: str,
+        query: dict[str, Any] | None,
+        request_headers: dict[str, str],
+        reservation: float | None = None,
+    ) -> dict[str, Any]:
         last_error: Exception | None = None
         retries_other = 0
         retries_429 = 0
         max_iterations = self.config.request_retries + self.config.http_429_max_retries + 500
 
         for _ in range(max_iterations):
-            reservation = self._sync_limiter.acquire()
+            if reservation is None:
+                reservation = self._sync_limiter.acquire()
+            recorded_at, reservation = reservation, None
             try:
                 response = self.session.request(method, url, params=query, headers=request_headers)
             except httpx.HTTPError as exc:
                 last_error = exc
+                if isinstance(exc, _UNSENT_REQUEST_ERRORS):
+                    self._sync_limiter.release(recorded_at)
                 if retries_other < self.config.request_retries:
                     retries_other += 1
                     time.sleep(self._retry_delay(retries_other - 1))
                     continue
-                raise BDLHTTPError(
-                    status_code=None,
-                    response_body=str(exc),
-                    url=url,
-                ) from exc
+                raise self._transport_error(exc, url) from exc
 
             if is_from_http_cache(response):
-                self._sync_limiter.release(reservation)
+                self._sync_limiter.release(recorded_at)
 
             if response.status_code == 429 and 429 in self.config.retry_status_codes:
                 if retries_429 < self.config.http_429_max_retries:
@@ -347,6 +576,7 @@ class BaseAPIClient:
         method: str = "GET",
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        reservation: float | None = None,
     ) -> dict[str, Any]:
         """
         Make a single HTTP request (sync).
@@ -356,6 +586,7 @@ class BaseAPIClient:
             method: HTTP method (default: GET).
             params: Query parameters (merged into the request).
             headers: Optional request headers.
+            reservation: Quota slot already reserved with ``acquire_many``.
 
         Returns:
             Decoded JSON response as a dictionary.
@@ -365,6 +596,7 @@ class BaseAPIClient:
             method=method,
             params=params,
             headers=headers,
+            reservation=reservation,
         )
 
     def _paginated_request_sync(
@@ -378,7 +610,9 @@ class BaseAPIClient:
         page_size: int = 100,
         max_pages: int | None = None,
         return_all: bool = True,
-    ) -> Iterator[dict[str, Any]]:
+        resume_from: str | None = None,
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
         """
         Fetch all paginated results synchronously.
 
@@ -391,42 +625,158 @@ class BaseAPIClient:
             page_size: Items per page.
             max_pages: Maximum pages to yield.
             return_all: If False, only returns first page.
+            resume_from: ``links.next`` URL to start from instead of the first page.
+            max_workers: Maximum pages fetched concurrently once the page count is known
+                (default: ``config.page_concurrency``).
 
         Yields:
             Response for each page as a dictionary.
         """
-        query = params.copy() if params else {}
-        lang = self.config.language.value if hasattr(self.config.language, "value") else self.config.language
-        query.setdefault("lang", lang)
-        query["page-size"] = page_size
-
-        fetched_pages = 0
-        next_url = None
-        first_page = True
+        query = self._build_query(params, page_size)
+        workers = self.config.page_concurrency if max_workers is None else max_workers
+        if workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+
+        if resume_from is None:
+            resp = self._request_sync(endpoint, method=method, params=query, headers=headers)
+        else:
+            resp = self._request_sync_url(resume_from, method=method, headers=headers)
+        if results_key not in resp:
+            raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
+        if not resp.get(results_key):
+            return
+        if not return_all or (max_pages and max_pages <= 1):
+            yield resp
+            return
 
-        while True:
-            if first_page:
-                resp = self._request_sync(endpoint, method=method, params=query, headers=headers)
-                first_page = False
-            else:
-                if not next_url:
+        total_pages = self._total_pages(resp, page_size, max_pages)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pybdl-page")
+        # Windowed page requests with the quota slot reserved for each, so slots of requests
+        # that never start can be handed back if the caller stops early.
+        pending: deque[tuple[Future[dict[str, Any]], float | None]] = deque()
+        try:
+            if (
+                resume_from is None
+                and resp.get("links", {}).get("next")
+                and total_pages is not None
+                and total_pages > 1
+                and workers > 1
+            ):
+                # The page count is known up front, so request the remaining pages by index on
+                # a pool of worker threads and yield them in order. As in the async paginator,
+                # the window is refilled in batches with one quota reservation per batch.
+                yield resp
+                remaining = iter(range(1, total_pages))
+
+                def refill() -> None:
+                    batch = workers - len(pending)
+                    if self._sync_limiter.max_batch_size is not None:
+                        batch = min(batch, self._sync_limiter.max_batch_size)
+                    pages = list(itertools.islice(remaining, batch))
+                    if not pages:
+                        return
+                    reservations = self._sync_limiter.acquire_many(len(pages))
+                    for page, reservation in zip(pages, reservations, strict=True):
+                        future = executor.submit(
+                            self._request_sync,
+                            endpoint,
+                            method=method,
+                            params={**query, "page": page},
+                            headers=headers,
+                            reservation=reservation,
+                        )
+                        pending.append((future, reservation))
+
+                refill()
+                while pending:
+                    resp = pending.popleft()[0].result()
+                    if len(pending) <= workers // 2:
+                        refill()
+                    if results_key not in resp:
+                        raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
+                    if not resp.get(results_key):
+                        return
+                    yield resp
+                return
+
+            # Otherwise follow ``links.next``, requesting the next page on a background thread
+            # while the caller processes the current one to overlap network I/O with parsing.
+            fetched_pages = 0
+            while True:
+                fetched_pages += 1
+                next_page: Future[dict[str, Any]] | None = None
+                if not (max_pages and fetched_pages >= max_pages):
+                    next_url = resp.get("links", {}).get("next")
+                    if next_url:
+                        next_page = executor.submit(self._request_sync_url, next_url, method=method, headers=headers)
+
+                yield resp
+
+                if next_page is None:
+                    break
+                resp = next_page.result()
+                if results_key not in resp:
+                    raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
+                if not resp.get(results_key):
                     break
-                resp = self._request_sync_url(next_url, method=method, headers=headers)
+        finally:
+            for future, reservation in pending:
+                if future.cancel():
+                    self._sync_limiter.release(reservation)
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            if results_key not in resp:
-                raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
-            if not resp.get(results_key):
-                break
-            yield resp
+    def _progress_pages_sync(
+        self,
+        endpoint: str,
+        *,
+        method: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        results_key: str,
+        page_size: int,
+        max_pages: int | None,
+        show_progress: bool,
+        resume_from: str | None,
+        on_page: Callable[[dict[str, Any]], None] | None,
+        max_workers: int | None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield validated pages, reporting progress and calling ``on_page`` once each page is consumed."""
+        progress_bar = (
+            tqdm(desc=f"Fetching {endpoint.split('/')[-1]}", unit=" pages", leave=True) if show_progress else None
+        )
+        first_page = True
+        item_count = 0
+        try:
+            for page in self._paginated_request_sync(
+                endpoint,
+                method=method,
+                params=params,
+                headers=headers,
+                results_key=results_key,
+                page_size=page_size,
+                max_pages=max_pages,
+                resume_from=resume_from,
+                max_workers=max_workers,
+            ):
+                if first_page:
+                    first_page = False
+                    if progress_bar is not None and resume_from is None:
+                        total_pages = self._total_pages(page, page_size, max_pages)
+                        if total_pages is not None:
+                            progress_bar.total = total_pages
 
-            fetched_pages += 1
-            if not return_all or (max_pages and fetched_pages >= max_pages):
-                break
+                yield page
 
-            links = resp.get("links", {})
-            next_url = links.get("next")
-            if not next_url:
-                break
+                item_count += len(page[results_key])
+                if on_page is not None:
+                    on_page(page)
+                if progress_bar is not None:
+                    # Let update() redraw the postfix; tqdm throttles that to its mininterval.
+                    progress_bar.set_postfix({"items": item_count}, refresh=False)
+                    progress_bar.update(1)
+        finally:
+            if progress_bar is not None:
+                progress_bar.close()
 
     @overload
     def fetch_all_results(
@@ -441,6 +791,10 @@ class BaseAPIClient:
         max_pages: int | None = None,
         return_metadata: Literal[False] = False,
         show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_workers: int | None = None,
+        stream: Literal[False] = False,
     ) -> list[dict[str, Any]]: ...
 
     @overload
@@ -456,8 +810,50 @@ class BaseAPIClient:
         max_pages: int | None = None,
         return_metadata: Literal[True],
         show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_workers: int | None = None,
+        stream: Literal[False] = False,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]: ...
 
+    @overload
+    def fetch_all_results(
+        self,
+        endpoint: str,
+        *,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        results_key: str = "results",
+        page_size: int = 100,
+        max_pages: int | None = None,
+        return_metadata: Literal[False] = False,
+        show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_workers: int | None = None,
+        stream: Literal[True],
+    ) -> Generator[dict[str, Any], None, None]: ...
+
+    @overload
+    def fetch_all_results(
+        self,
+        endpoint: str,
+        *,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        results_key: str = "results",
+        page_size: int = 100,
+        max_pages: int | None = None,
+        return_metadata: bool,
+        show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_workers: int | None = None,
+        stream: Literal[False] = False,
+    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]]: ...
+
     def fetch_all_results(
         self,
         endpoint: str,
@@ -470,7 +866,11 @@ class BaseAPIClient:
         max_pages: int | None = None,
         return_metadata: bool = False,
         show_progress: bool = True,
-    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]]:
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_workers: int | None = None,
+        stream: bool = False,
+    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]] | Generator[dict[str, Any], None, None]:
         """
         Fetch paginated results synchronously and combine them into a single list.
 
@@ -484,45 +884,49 @@ class BaseAPIClient:
             max_pages: Optional limit of pages.
             return_metadata: If True, return (results, metadata).
             show_progress: Display progress via tqdm.
+            resume_from: ``links.next`` URL of the last page processed by an earlier,
+                interrupted fetch; fetching continues from there instead of the first page.
+                Metadata then comes from the first resumed page.
+            on_page: Called with each page after its results have been collected. Store
+                ``page["links"].get("next")`` to checkpoint progress for ``resume_from``.
+            max_workers: Maximum number of pages fetched concurrently on worker threads once
+                the first page reports the total record count (default:
+                ``config.page_concurrency``). Use 1 to follow ``links.next`` page by page.
+            stream: If True, return a lazy iterator over the results instead of a list, so
+                pages are fetched as the caller consumes them. Cannot be combined with
+                ``return_metadata``.
 
         Returns:
-            Combined list of results, optionally with metadata.
+            Combined list of results, optionally with metadata, or an iterator of results
+            when ``stream`` is True.
         """
-        all_results: list[dict[str, Any]] = []
-        metadata: dict[str, Any] = {}
-        progress_bar = (
-            tqdm(desc=f"Fetching {endpoint.split('/')[-1]}", unit=" pages", leave=True) if show_progress else None
+        if stream and return_metadata:
+            raise ValueError("stream=True cannot be combined with return_metadata=True")
+
+        pages = self._progress_pages_sync(
+            endpoint,
+            method=method,
+            params=params,
+            headers=headers,
+            results_key=results_key,
+            page_size=page_size,
+            max_pages=max_pages,
+            show_progress=show_progress,
+            resume_from=resume_from,
+            on_page=on_page,
+            max_workers=max_workers,
         )
+        if stream:
+            return (item for page in pages for item in page[results_key])
 
+        all_results: list[dict[str, Any]] = []
+        metadata: dict[str, Any] = {}
         first_page = True
-        try:
-            for page in self._paginated_request_sync(
-                endpoint,
-                method=method,
-                params=params,
-                headers=headers,
-                results_key=results_key,
-                page_size=page_size,
-                max_pages=max_pages,
-            ):
-                if results_key not in page:
-                    raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=page)
-                if first_page and return_metadata:
-                    metadata = self._metadata_from_response(page, results_key)
-                    if progress_bar is not None and "totalCount" in page:
-                        total_pages = (page["totalCount"] + page_size - 1) // page_size
-                        total_pages = min(total_pages, max_pages) if max_pages else total_pages
-                        progress_bar.total = total_pages
-                    first_page = False
-
-                all_results.extend(page.get(results_key, []))
-
-                if progress_bar is not None:
-                    progress_bar.update(1)
-                    progress_bar.set_postfix({"items": len(all_results)})
-        finally:
-            if progress_bar is not None:
-                progress_bar.close()
+        for page in pages:
+            if first_page and return_metadata:
+                metadata = self._metadata_from_response(page, results_key)
+            first_page = False
+            all_results.extend(page[results_key])
 
         return (all_results, metadata) if return_metadata else all_results
 
@@ -537,6 +941,9 @@ class BaseAPIClient:
         page_size: int = 100,
         max_pages: int | None = None,
         show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_workers: int | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         return self.fetch_all_results(
             endpoint,
@@ -548,6 +955,9 @@ class BaseAPIClient:
             max_pages=max_pages,
             return_metadata=True,
             show_progress=show_progress,
+            resume_from=resume_from,
+            on_page=on_page,
+            max_workers=max_workers,
         )
 
     @overload
@@ -598,6 +1008,18 @@ class BaseAPIClient:
         return_metadata: Literal[True],
     ) -> tuple[dict[str, Any], dict[str, Any]]: ...
 
+    @overload
+    def fetch_single_result(
+        self,
+        endpoint: str,
+        *,
+        results_key: str,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        return_metadata: bool,
+    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]]: ...
+
     def fetch_single_result(
         self,
         endpoint: str,
@@ -689,12 +1111,11 @@ class BaseAPIClient:
         )
 
         if max_pages == 1:
-            params_with_page_size = params.copy()
-            params_with_page_size["page-size"] = page_size
+            params["page-size"] = page_size
             return self.fetch_single_result(
                 endpoint,
                 results_key=results_key,
-                params=params_with_page_size,
+                params=params,
                 headers=headers,
             )
 
@@ -707,6 +1128,34 @@ class BaseAPIClient:
             results_key=results_key,
         )
 
+    def _iter_collection_endpoint(
+        self,
+        endpoint: str,
+        *,
+        extra_params: dict[str, Any] | None = None,
+        lang: LanguageLiteral | None = None,
+        format: str | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        results_key: str = "results",
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        params, headers = self._prepare_api_params_and_headers(
+            lang=lang,
+            format=cast(FormatLiteral | None, format),
+            extra_params=extra_params,
+        )
+        return self.fetch_all_results(
+            endpoint,
+            params=params,
+            headers=headers,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key=results_key,
+            max_workers=max_workers,
+            stream=True,
+        )
+
     def _fetch_detail_endpoint(
         self,
         endpoint: str,
@@ -724,7 +1173,104 @@ class BaseAPIClient:
             if_modified_since=if_modified_since,
             extra_params=extra_params,
         )
-        return self.fetch_single_result(endpoint, params=params or None, headers=headers or None)
+        return self.fetch_single_result(endpoint, params=params, headers=headers)
+
+    def _map_concurrently(
+        self, fetch: Callable[[_KeyT], _ResultT], keys: Sequence[_KeyT], max_workers: int | None
+    ) -> list[_ResultT]:
+        """Call ``fetch`` for every key on up to ``max_workers`` threads and return results in key order."""
+        workers = self.config.page_concurrency if max_workers is None else max_workers
+        if workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+        if len(keys) <= 1 or workers == 1:
+            return [fetch(key) for key in keys]
+        with ThreadPoolExecutor(max_workers=min(workers, len(keys)), thread_name_prefix="pybdl-batch") as pool:
+            return list(pool.map(fetch, keys))
+
+    async def _amap_concurrently(
+        self, fetch: Callable[[_KeyT], Awaitable[_ResultT]], keys: Sequence[_KeyT], max_concurrent: int | None
+    ) -> list[_ResultT]:
+        """Await ``fetch`` for every key with at most ``max_concurrent`` in flight and return results in key order."""
+        concurrency = self.config.page_concurrency if max_concurrent is None else max_concurrent
+        if concurrency <= 0:
+            raise ValueError("max_concurrent must be a positive integer")
+        limit = asyncio.Semaphore(concurrency)
+
+        async def bounded(key: _KeyT) -> _ResultT:
+            async with limit:
+                return await fetch(key)
+
+        # Let every call finish before raising, so no request is left running unobserved.
+        outcomes = await asyncio.gather(*(bounded(key) for key in keys), return_exceptions=True)
+        results: list[_ResultT] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+        return results
+
+    def map_calls(
+        self, fn: Callable[..., _ResultT], calls: Iterable[tuple[Any, ...]], max_workers: int | None = None
+    ) -> list[_ResultT]:
+        """
+        Run independent calls such as ``fn(*args)`` on a thread pool and return their results in order.
+
+        Useful for bulk lookups like ``api.map_calls(api.get_level, [(1,), (2,), (3,)])``. Calls run
+        on up to ``max_workers`` threads (default: ``config.page_concurrency``) and share this
+        client's connection pool and rate limiter. If any call fails, the first error in call order
+        is raised after the remaining calls have finished.
+        """
+        return self._map_concurrently(lambda args: fn(*args), list(calls), max_workers)
+
+    async def amap_calls(
+        self,
+        fn: Callable[..., Awaitable[_ResultT]],
+        calls: Iterable[tuple[Any, ...]],
+        max_concurrent: int | None = None,
+    ) -> list[_ResultT]:
+        """Await independent calls such as ``fn(*args)`` with bounded concurrency; see :meth:`map_calls`."""
+        return await self._amap_concurrently(lambda args: fn(*args), list(calls), max_concurrent)
+
+    def _cached_metadata(self, key: tuple[str, str | None, str | None]) -> dict[str, Any] | None:
+        entry = self._metadata_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.config.metadata_cache_ttl:
+            return None
+        return dict(entry[1])
+
+    def _store_metadata(self, key: tuple[str, str | None, str | None], metadata: dict[str, Any]) -> None:
+        if self.config.metadata_cache_ttl > 0:
+            self._metadata_cache[key] = (time.monotonic(), dict(metadata))
+
+    def _fetch_metadata_endpoint(
+        self,
+        endpoint: str,
+        *,
+        extra_params: dict[str, Any] | None = None,
+        lang: LanguageLiteral | None = None,
+        format: str | None = None,
+        if_none_match: str | None = None,
+        if_modified_since: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch a ``*/metadata`` endpoint, reusing the result for ``config.metadata_cache_ttl`` seconds.
+
+        Calls with conditional headers or extra query parameters always go to the API.
+        """
+        cacheable = not (if_none_match or if_modified_since or extra_params)
+        key = (endpoint, lang, format)
+        if cacheable and (cached := self._cached_metadata(key)) is not None:
+            return cached
+        metadata = self._fetch_detail_endpoint(
+            endpoint,
+            extra_params=extra_params,
+            lang=lang,
+            format=format,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
+        )
+        if cacheable:
+            self._store_metadata(key, metadata)
+        return metadata
 
     async def _request_async_url(
         self,
@@ -733,37 +1279,83 @@ class BaseAPIClient:
         method: str = "GET",
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        reservation: float | None = None,
     ) -> dict[str, Any]:
-        query = params.copy() if params else None
-        lang = self.config.language.value if hasattr(self.config.language, "value") else self.config.language
-        if params is not None or "?" not in url:
-            query = query or {}
-            query.setdefault("lang", lang)
-        request_headers = self._merge_headers(headers)
+        """
+        Make a single HTTP request to a full URL (async).
 
+        Identical concurrent GET requests are coalesced: only the first caller issues the
+        HTTP request and every other caller awaits the same in-flight task, so they all
+        receive the same decoded payload object.
+
+        ``reservation`` is a quota slot already taken with ``acquire_many``; it is used for
+        the first attempt instead of acquiring a new one.
+        """
+        # A full ``links.next`` URL already carries its query string.
+        query = self._build_query(params) if params is not None or "?" not in url else None
+        request_headers = self._conditional_headers(method, url, query, self._merge_headers(headers))
+
+        if method.upper() != "GET":
+            return await self._send_async_request(
+                url, method=method, query=query, request_headers=request_headers, reservation=reservation
+            )
+
+        key = self._request_key(method, url, query, request_headers)
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(
+                self._send_async_request(
+                    url, method=method, query=query, request_headers=request_headers, reservation=reservation
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+        elif reservation is not None:
+            # The request is already in flight, so the slot reserved for it is not needed.
+            await self._async_limiter.release(reservation)
+        # Shield the shared task so a cancelled caller does not cancel it for the others.
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: tuple[Any, ...], task: "asyncio.Task[dict[str, Any]]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter has gone away.
+            task.exception()
+
+    async def _send_async_request(
+        self,
+        url: str,
+        *,
+        method: str,
+        query: dict[str, Any] | None,
+        request_headers: dict[str, str],
+        reservation: float | None = None,
+    ) -> dict[str, Any]:
         last_error: Exception | None = None
         retries_other = 0
         retries_429 = 0
         max_iterations = self.config.request_retries + self.config.http_429_max_retries + 500
 
         for _ in range(max_iterations):
-            reservation = await self._async_limiter.acquire()
+            if reservation is None:
+                reservation = await self._async_limiter.acquire()
+            recorded_at, reservation = reservation, None
             try:
                 response = await self._async_client.request(method, url, params=query, headers=request_headers)
             except httpx.HTTPError as exc:
                 last_error = exc
+                if isinstance(exc, _UNSENT_REQUEST_ERRORS):
+                    await self._async_limiter.release(recorded_at)
                 if retries_other < self.config.request_retries:
                     retries_other += 1
                     await asyncio.sleep(self._retry_delay(retries_other - 1))
                     continue
-                raise BDLHTTPError(
-                    status_code=getattr(getattr(exc, "response", None), "status_code", None),
-                    response_body=str(exc),
-                    url=url,
-                ) from exc
+                raise self._transport_error(exc, url) from exc
 
             if is_from_http_cache(response):
-                await self._async_limiter.release(reservation)
+                await self._async_limiter.release(recorded_at)
 
             if response.status_code == 429 and 429 in self.config.retry_status_codes:
                 if retries_429 < self.config.http_429_max_retries:
@@ -792,6 +1384,7 @@ class BaseAPIClient:
         method: str = "GET",
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        reservation: float | None = None,
     ) -> dict[str, Any]:
         """
         Make a single HTTP request (async).
@@ -801,6 +1394,7 @@ class BaseAPIClient:
             method=method,
             params=params,
             headers=headers,
+            reservation=reservation,
         )
 
     async def _paginated_request_async(
@@ -814,42 +1408,172 @@ class BaseAPIClient:
         page_size: int = 100,
         max_pages: int | None = None,
         return_all: bool = True,
-    ) -> AsyncIterator[dict[str, Any]]:
+        resume_from: str | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
         """
         Fetch all paginated results asynchronously.
 
-        Yields each page's JSON as a dict.
+        Yields each page's JSON as a dict. When ``resume_from`` is given, fetching starts at
+        that ``links.next`` URL and follows the links sequentially. ``max_concurrent`` caps
+        the pages requested at once (default: ``config.page_concurrency``).
         """
-        query = params.copy() if params else {}
-        lang = self.config.language.value if hasattr(self.config.language, "value") else self.config.language
-        query.setdefault("lang", lang)
-        query["page-size"] = page_size
+        query = self._build_query(params, page_size)
+        window = self.config.page_concurrency if max_concurrent is None else max_concurrent
+        if window <= 0:
+            raise ValueError("max_concurrent must be a positive integer")
+
+        if resume_from is None:
+            resp = await self._request_async(endpoint, method=method, params=query, headers=headers)
+        else:
+            resp = await self._request_async_url(resume_from, method=method, headers=headers)
+        if results_key not in resp:
+            raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
+        if not resp.get(results_key):
+            return
+        if not return_all or (max_pages and max_pages <= 1):
+            yield resp
+            return
 
-        fetched_pages = 0
-        next_url = None
-        first_page = True
+        next_url = resp.get("links", {}).get("next")
+        total_pages = self._total_pages(resp, page_size, max_pages)
+        if resume_from is None and next_url and total_pages is not None and total_pages > 1 and window > 1:
+            yield resp
+            # The page count is known up front, so request the remaining pages by index with a
+            # bounded window of concurrent requests and yield them in order. The window is
+            # refilled in batches once half of it has drained, reserving quota for each batch
+            # with a single limiter call.
+            remaining = iter(range(1, total_pages))
+            # Each task is paired with a one-item slot holding its reserved quota; the task takes
+            # the reservation when it starts, so slots still full at exit were never used.
+            pending: deque[tuple[asyncio.Task[dict[str, Any]], list[float | None]]] = deque()
+
+            async def request_page(page: int, slot: list[float | None]) -> dict[str, Any]:
+                return await self._request_async(
+                    endpoint,
+                    method=method,
+                    params={**query, "page": page},
+                    headers=headers,
+                    reservation=slot.pop(),
+                )
+
+            async def refill() -> None:
+                batch = window - len(pending)
+                if self._async_limiter.max_batch_size is not None:
+                    batch = min(batch, self._async_limiter.max_batch_size)
+                pages = list(itertools.islice(remaining, batch))
+                if not pages:
+                    return
+                reservations = await self._async_limiter.acquire_many(len(pages))
+                for page, reservation in zip(pages, reservations, strict=True):
+                    slot = [reservation]
+                    pending.append((asyncio.ensure_future(request_page(page, slot)), slot))
 
-        while True:
-            if first_page:
-                resp = await self._request_async(endpoint, method=method, params=query, headers=headers)
-                first_page = False
-            else:
-                if not next_url:
+            try:
+                await refill()
+                while pending:
+                    resp = await pending.popleft()[0]
+                    if len(pending) <= window // 2:
+                        await refill()
+                    if results_key not in resp:
+                        raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
+                    if not resp.get(results_key):
+                        return
+                    yield resp
+            finally:
+                for task, _ in pending:
+                    task.cancel()
+                # Retrieve outstanding results so failed or cancelled tasks are not reported as unhandled.
+                await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+                for _, slot in pending:
+                    if slot:
+                        await self._async_limiter.release(slot[0])
+            return
+
+        # Otherwise follow ``links.next``, requesting the next page as a task while the caller
+        # processes the current one, as the sync paginator does on a background thread.
+        fetched_pages = 0
+        next_page: asyncio.Task[dict[str, Any]] | None = None
+        try:
+            while True:
+                fetched_pages += 1
+                if not (max_pages and fetched_pages >= max_pages):
+                    next_url = resp.get("links", {}).get("next")
+                    if next_url:
+                        next_page = asyncio.ensure_future(
+                            self._request_async_url(next_url, method=method, headers=headers)
+                        )
+
+                yield resp
+
+                if next_page is None:
                     break
-                resp = await self._request_async_url(next_url, method=method, headers=headers)
+                resp = await next_page
+                next_page = None
+                if results_key not in resp:
+                    raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
+                if not resp.get(results_key):
+                    break
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                # Retrieve the outcome so a failed or cancelled prefetch is not reported as unhandled.
+                await asyncio.gather(next_page, return_exceptions=True)
 
-            if results_key not in resp:
-                raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=resp)
-            if not resp.get(results_key):
-                break
+    async def _progress_pages_async(
+        self,
+        endpoint: str,
+        *,
+        method: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        results_key: str,
+        page_size: int,
+        max_pages: int | None,
+        show_progress: bool,
+        resume_from: str | None,
+        on_page: Callable[[dict[str, Any]], None] | None,
+        max_concurrent: int | None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield validated pages, reporting progress and calling ``on_page`` once each page is consumed."""
+        progress_bar = (
+            tqdm(desc=f"Fetching {endpoint.split('/')[-1]} (async)", unit=" pages", leave=True)
+            if show_progress
+            else None
+        )
+        first_page = True
+        item_count = 0
+        try:
+            async for page in self._paginated_request_async(
+                endpoint,
+                method=method,
+                params=params,
+                headers=headers,
+                results_key=results_key,
+                page_size=page_size,
+                max_pages=max_pages,
+                resume_from=resume_from,
+                max_concurrent=max_concurrent,
+            ):
+                if first_page:
+                    first_page = False
+                    if progress_bar is not None and resume_from is None:
+                        total_pages = self._total_pages(page, page_size, max_pages)
+                        if total_pages is not None:
+                            progress_bar.total = total_pages
 
-            yield resp
-            fetched_pages += 1
-            if not return_all or (max_pages and fetched_pages >= max_pages):
-                break
-            next_url = resp.get("links", {}).get("next")
-            if not next_url:
-                break
+                yield page
+
+                item_count += len(page[results_key])
+                if on_page is not None:
+                    on_page(page)
+                if progress_bar is not None:
+                    # Let update() redraw the postfix; tqdm throttles that to its mininterval.
+                    progress_bar.set_postfix({"items": item_count}, refresh=False)
+                    progress_bar.update(1)
+        finally:
+            if progress_bar is not None:
+                progress_bar.close()
 
     @overload
     async def afetch_all_results(
@@ -864,6 +1588,10 @@ class BaseAPIClient:
         max_pages: int | None = None,
         return_metadata: Literal[False] = False,
         show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_concurrent: int | None = None,
+        stream: Literal[False] = False,
     ) -> list[dict[str, Any]]: ...
 
     @overload
@@ -879,8 +1607,50 @@ class BaseAPIClient:
         max_pages: int | None = None,
         return_metadata: Literal[True],
         show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_concurrent: int | None = None,
+        stream: Literal[False] = False,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]: ...
 
+    @overload
+    async def afetch_all_results(
+        self,
+        endpoint: str,
+        *,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        results_key: str = "results",
+        page_size: int = 100,
+        max_pages: int | None = None,
+        return_metadata: Literal[False] = False,
+        show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_concurrent: int | None = None,
+        stream: Literal[True],
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    @overload
+    async def afetch_all_results(
+        self,
+        endpoint: str,
+        *,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        results_key: str = "results",
+        page_size: int = 100,
+        max_pages: int | None = None,
+        return_metadata: bool,
+        show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_concurrent: int | None = None,
+        stream: Literal[False] = False,
+    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]]: ...
+
     async def afetch_all_results(
         self,
         endpoint: str,
@@ -893,7 +1663,11 @@ class BaseAPIClient:
         max_pages: int | None = None,
         return_metadata: bool = False,
         show_progress: bool = True,
-    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]]:
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_concurrent: int | None = None,
+        stream: bool = False,
+    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]] | AsyncIterator[dict[str, Any]]:
         """
         Asynchronously fetch paginated results and combine them into a single list.
 
@@ -907,46 +1681,49 @@ class BaseAPIClient:
             max_pages: Optional limit of pages.
             return_metadata: If True, return (results, metadata).
             show_progress: Display progress via tqdm.
+            resume_from: ``links.next`` URL of the last page processed by an earlier,
+                interrupted fetch; fetching continues from there instead of the first page.
+                Metadata then comes from the first resumed page.
+            on_page: Called with each page after its results have been collected. Store
+                ``page["links"].get("next")`` to checkpoint progress for ``resume_from``.
+            max_concurrent: Maximum number of page requests in flight at once after the first
+                page reports the total record count (default: ``config.page_concurrency``).
+                Use 1 to follow ``links.next`` page by page.
+            stream: If True, return a lazy async iterator over the results instead of a list,
+                so pages are fetched as the caller consumes them. Cannot be combined with
+                ``return_metadata``.
 
         Returns:
-            Combined list of results, optionally with metadata.
+            Combined list of results, optionally with metadata, or an async iterator of
+            results when ``stream`` is True.
         """
+        if stream and return_metadata:
+            raise ValueError("stream=True cannot be combined with return_metadata=True")
+
+        pages = self._progress_pages_async(
+            endpoint,
+            method=method,
+            params=params,
+            headers=headers,
+            results_key=results_key,
+            page_size=page_size,
+            max_pages=max_pages,
+            show_progress=show_progress,
+            resume_from=resume_from,
+            on_page=on_page,
+            max_concurrent=max_concurrent,
+        )
+        if stream:
+            return (item async for page in pages for item in page[results_key])
+
         all_results: list[dict[str, Any]] = []
         metadata: dict[str, Any] = {}
         first_page = True
-        progress_bar = (
-            tqdm(desc=f"Fetching {endpoint.split('/')[-1]} (async)", unit=" pages", leave=True)
-            if show_progress
-            else None
-        )
-
-        try:
-            async for page in self._paginated_request_async(
-                endpoint,
-                method=method,
-                params=params,
-                headers=headers,
-                results_key=results_key,
-                page_size=page_size,
-                max_pages=max_pages,
-            ):
-                if results_key not in page:
-                    raise BDLResponseError(f"Response does not contain key '{results_key}'", payload=page)
-                if first_page and return_metadata:
-                    metadata = self._metadata_from_response(page, results_key)
-                    if progress_bar is not None and "totalCount" in page:
-                        total_pages = (page["totalCount"] + page_size - 1) // page_size
-                        total_pages = min(total_pages, max_pages) if max_pages else total_pages
-                        progress_bar.total = total_pages
-                    first_page = False
-
-                all_results.extend(page.get(results_key, []))
-                if progress_bar is not None:
-                    progress_bar.update(1)
-                    progress_bar.set_postfix({"items": len(all_results)})
-        finally:
-            if progress_bar is not None:
-                progress_bar.close()
+        async for page in pages:
+            if first_page and return_metadata:
+                metadata = self._metadata_from_response(page, results_key)
+            first_page = False
+            all_results.extend(page[results_key])
 
         return (all_results, metadata) if return_metadata else all_results
 
@@ -961,6 +1738,9 @@ class BaseAPIClient:
         page_size: int = 100,
         max_pages: int | None = None,
         show_progress: bool = True,
+        resume_from: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
+        max_concurrent: int | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         return await self.afetch_all_results(
             endpoint,
@@ -972,6 +1752,9 @@ class BaseAPIClient:
             max_pages=max_pages,
             return_metadata=True,
             show_progress=show_progress,
+            resume_from=resume_from,
+            on_page=on_page,
+            max_concurrent=max_concurrent,
         )
 
     @overload
@@ -1022,6 +1805,18 @@ class BaseAPIClient:
         headers: dict[str, str] | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]: ...
 
+    @overload
+    async def afetch_single_result(
+        self,
+        endpoint: str,
+        *,
+        results_key: str,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        return_metadata: bool,
+    ) -> list[dict[str, Any]] | tuple[list[dict[str, Any]], dict[str, Any]]: ...
+
     async def afetch_single_result(
         self,
         endpoint: str,
@@ -1111,12 +1906,11 @@ class BaseAPIClient:
         )
 
         if max_pages == 1:
-            params_with_page_size = params.copy()
-            params_with_page_size["page-size"] = page_size
+            params["page-size"] = page_size
             return await self.afetch_single_result(
                 endpoint,
                 results_key=results_key,
-                params=params_with_page_size,
+                params=params,
                 headers=headers,
             )
 
@@ -1129,6 +1923,36 @@ class BaseAPIClient:
             results_key=results_key,
         )
 
+    async def _aiter_collection_endpoint(
+        self,
+        endpoint: str,
+        *,
+        extra_params: dict[str, Any] | None = None,
+        lang: LanguageLiteral | None = None,
+        format: str | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        results_key: str = "results",
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        params, headers = self._prepare_api_params_and_headers(
+            lang=lang,
+            format=cast(FormatLiteral | None, format),
+            extra_params=extra_params,
+        )
+        rows = await self.afetch_all_results(
+            endpoint,
+            params=params,
+            headers=headers,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key=results_key,
+            max_concurrent=max_concurrent,
+            stream=True,
+        )
+        async for row in rows:
+            yield row
+
     async def _afetch_detail_endpoint(
         self,
         endpoint: str,
@@ -1146,4 +1970,31 @@ class BaseAPIClient:
             if_modified_since=if_modified_since,
             extra_params=extra_params,
         )
-        return await self.afetch_single_result(endpoint, params=params or None, headers=headers or None)
+        return await self.afetch_single_result(endpoint, params=params, headers=headers)
+
+    async def _afetch_metadata_endpoint(
+        self,
+        endpoint: str,
+        *,
+        extra_params: dict[str, Any] | None = None,
+        lang: LanguageLiteral | None = None,
+        format: str | None = None,
+        if_none_match: str | None = None,
+        if_modified_since: str | None = None,
+    ) -> dict[str, Any]:
+        """Asynchronously fetch a ``*/metadata`` endpoint; see :meth:`_fetch_metadata_endpoint`."""
+        cacheable = not (if_none_match or if_modified_since or extra_params)
+        key = (endpoint, lang, format)
+        if cacheable and (cached := self._cached_metadata(key)) is not None:
+            return cached
+        metadata = await self._afetch_detail_endpoint(
+            endpoint,
+            extra_params=extra_params,
+            lang=lang,
+            format=format,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
+        )
+        if cacheable:
+            self._store_metadata(key, metadata)
+        return metadata
@@ -1,4 +1,6 @@
-from collections.abc import Sequence
+import asyncio
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass, field
 from typing import Any, cast
 
 from pybdl.api.client import (
@@ -6,12 +8,25 @@ from pybdl.api.client import (
     FormatLiteral,
     LanguageLiteral,
 )
+from pybdl.config import BDLConfig
 
 # Payload + optional metadata as returned by BaseAPIClient fetch helpers for /data collection routes
 _DataJsonPayload = dict[str, Any] | list[dict[str, Any]]
 _DataWithMetadata = tuple[_DataJsonPayload, dict[str, Any]]
 _DataCollectionResult = list[dict[str, Any]] | _DataWithMetadata
 
+# The /data/by-unit routes accept at most this many ``var-id`` values per request.
+MAX_VARIABLES_PER_REQUEST = 50
+
+
+@dataclass
+class _UnitBatch:
+    """Concurrent by-unit calls waiting to be sent as one request with merged ``var-id`` values."""
+
+    variable_ids: dict[int, None] = field(default_factory=dict)
+    waiters: list[tuple[set[str], asyncio.Future[list[dict[str, Any]]]]] = field(default_factory=list)
+    flush: asyncio.Task[None] | None = None
+
 
 class DataAPI(BaseAPIClient):
     """
@@ -25,6 +40,11 @@ class DataAPI(BaseAPIClient):
     enabling users to fetch statistical data by variable, unit, and locality.
     """
 
+    def __init__(self, config: BDLConfig, extra_headers: dict[str, str] | None = None):
+        super().__init__(config, extra_headers)
+        # (loop, unit_id, years, aggregate_id, page_size, lang, format) -> batch being collected.
+        self._unit_batches: dict[tuple[Any, ...], _UnitBatch] = {}
+
     @staticmethod
     def _normalize_variable_ids(
         variable_ids: Sequence[str | int] | str | int | None,
@@ -43,20 +63,16 @@ class DataAPI(BaseAPIClient):
         page: int | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if years:
-            params["year"] = years
-        if unit_parent_id:
-            params["unit-parent-id"] = unit_parent_id
-        if unit_level is not None:
-            params["unit-level"] = unit_level
-        if aggregate_id is not None:
-            params["aggregate-id"] = aggregate_id
-        if page is not None:
-            params["page"] = page
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return DataAPI._assemble_params(
+            {
+                "year": years,
+                "unit-parent-id": unit_parent_id,
+                "unit-level": unit_level,
+                "aggregate-id": aggregate_id,
+                "page": page,
+            },
+            extra_query,
+        )
 
     def _data_by_unit_params(
         self,
@@ -66,16 +82,15 @@ class DataAPI(BaseAPIClient):
         page: int | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"var-id": self._normalize_variable_ids(variable_ids)}
-        if years:
-            params["year"] = years
-        if aggregate_id is not None:
-            params["aggregate-id"] = aggregate_id
-        if page is not None:
-            params["page"] = page
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return self._assemble_params(
+            {
+                "var-id": self._normalize_variable_ids(variable_ids),
+                "year": years,
+                "aggregate-id": aggregate_id,
+                "page": page,
+            },
+            extra_query,
+        )
 
     @staticmethod
     def _data_by_variable_locality_params(
@@ -84,127 +99,79 @@ class DataAPI(BaseAPIClient):
         page: int | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"unit-parent-id": unit_parent_id}
-        if years:
-            params["year"] = years
-        if page is not None:
-            params["page"] = page
-        if extra_query:
-            params.update(extra_query)
-        return params
-
-    def _data_by_unit_locality_params(
-        self,
-        variable_ids: Sequence[str | int] | str | int | None,
-        years: list[int] | None,
-        aggregate_id: int | None,
-        page: int | None,
-        extra_query: dict[str, Any] | None,
-    ) -> dict[str, Any]:
-        return self._data_by_unit_params(variable_ids, years, aggregate_id, page, extra_query)
+        return DataAPI._assemble_params(
+            {"unit-parent-id": unit_parent_id, "year": years, "page": page},
+            extra_query,
+        )
+
+    @staticmethod
+    def _variable_chunks(variable_ids: Sequence[str | int] | str | int | None, chunk_size: int) -> list[list[int]]:
+        if not 0 < chunk_size <= MAX_VARIABLES_PER_REQUEST:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_VARIABLES_PER_REQUEST}")
+        ids = DataAPI._normalize_variable_ids(variable_ids)
+        return [ids[start : start + chunk_size] for start in range(0, len(ids), chunk_size)]
+
+    @staticmethod
+    def _merge_unit_batches(
+        batches: list[tuple[list[dict[str, Any]], dict[str, Any]]], return_metadata: bool
+    ) -> _DataCollectionResult:
+        """Concatenate per-chunk results; metadata comes from the first chunk with record counts summed."""
+        results = [row for rows, _ in batches for row in rows]
+        if not return_metadata:
+            return results
+        metadata = dict(batches[0][1]) if batches else {}
+        totals = [chunk_metadata.get("totalRecords") for _, chunk_metadata in batches]
+        if totals and all(isinstance(total, int) for total in totals):
+            metadata["totalRecords"] = sum(cast(list[int], totals))
+        return results, metadata
 
     def _prepare_collection_request(
         self,
+        query: dict[str, Any],
         *,
-        extra_params: dict[str, Any],
         format: FormatLiteral | None,
         lang: LanguageLiteral | None,
-        if_none_match: str | None,
-        if_modified_since: str | None,
+        if_none_match: str | None = None,
+        if_modified_since: str | None = None,
     ) -> tuple[dict[str, Any], dict[str, str]]:
         return self._prepare_api_params_and_headers(
             lang=lang,
             format=format,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-            extra_params=extra_params,
-        )
-
-    def _fetch_single_page_data_collection(
-        self,
-        endpoint: str,
-        *,
-        params: dict[str, Any],
-        headers: dict[str, str] | None,
-        page_size: int,
-        return_metadata: bool,
-    ) -> _DataCollectionResult:
-        params_with_page_size = params.copy()
-        params_with_page_size["page-size"] = page_size
-        if return_metadata:
-            return self.fetch_single_result_with_metadata(
-                endpoint,
-                results_key="results",
-                params=params_with_page_size,
-                headers=headers,
-            )
-        return self.fetch_single_result(
-            endpoint,
-            results_key="results",
-            params=params_with_page_size,
-            headers=headers,
-        )
-
-    async def _afetch_single_page_data_collection(
-        self,
-        endpoint: str,
-        *,
-        params: dict[str, Any],
-        headers: dict[str, str] | None,
-        page_size: int,
-        return_metadata: bool,
-    ) -> _DataCollectionResult:
-        params_with_page_size = params.copy()
-        params_with_page_size["page-size"] = page_size
-        if return_metadata:
-            return await self.afetch_single_result_with_metadata(
-                endpoint,
-                results_key="results",
-                params=params_with_page_size,
-                headers=headers,
-            )
-        return await self.afetch_single_result(
-            endpoint,
-            results_key="results",
-            params=params_with_page_size,
-            headers=headers,
+            extra_params=query,
         )
 
-    def _fetch_data_collection(
+    def _run_data_endpoint(
         self,
         endpoint: str,
+        query: dict[str, Any],
         *,
-        params: dict[str, Any],
-        headers: dict[str, str] | None,
+        format: FormatLiteral | None,
+        lang: LanguageLiteral | None,
+        if_none_match: str | None,
+        if_modified_since: str | None,
         page_size: int,
         max_pages: int | None,
         return_metadata: bool,
+        max_workers: int | None = None,
     ) -> _DataCollectionResult:
+        """Fetch a /data collection route; ``max_pages=1`` requests a single page without pagination."""
+        params, headers = self._prepare_collection_request(
+            query,
+            format=format,
+            lang=lang,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
+        )
         if max_pages == 1:
-            params_with_page_size = params.copy()
-            params_with_page_size["page-size"] = page_size
-            if return_metadata:
-                return self.fetch_single_result_with_metadata(
-                    endpoint,
-                    results_key="results",
-                    params=params_with_page_size,
-                    headers=headers,
-                )
+            params["page-size"] = page_size
             return self.fetch_single_result(
                 endpoint,
                 results_key="results",
-                params=params_with_page_size,
-                headers=headers,
-            )
-
-        if return_metadata:
-            return self.fetch_all_results_with_metadata(
-                endpoint,
                 params=params,
                 headers=headers,
-                page_size=page_size,
-                max_pages=max_pages,
-                results_key="results",
+                return_metadata=return_metadata,
             )
         return self.fetch_all_results(
             endpoint,
@@ -213,43 +180,40 @@ class DataAPI(BaseAPIClient):
             page_size=page_size,
             max_pages=max_pages,
             results_key="results",
+            return_metadata=return_metadata,
+            max_workers=max_workers,
         )
 
-    async def _afetch_data_collection(
+    async def _arun_data_endpoint(
         self,
         endpoint: str,
+        query: dict[str, Any],
         *,
-        params: dict[str, Any],
-        headers: dict[str, str] | None,
+        format: FormatLiteral | None,
+        lang: LanguageLiteral | None,
+        if_none_match: str | None,
+        if_modified_since: str | None,
         page_size: int,
         max_pages: int | None,
         return_metadata: bool,
+        max_concurrent: int | None = None,
     ) -> _DataCollectionResult:
+        """Asynchronously fetch a /data collection route; see :meth:`_run_data_endpoint`."""
+        params, headers = self._prepare_collection_request(
+            query,
+            format=format,
+            lang=lang,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
+        )
         if max_pages == 1:
-            params_with_page_size = params.copy()
-            params_with_page_size["page-size"] = page_size
-            if return_metadata:
-                return await self.afetch_single_result_with_metadata(
-                    endpoint,
-                    results_key="results",
-                    params=params_with_page_size,
-                    headers=headers,
-                )
+            params["page-size"] = page_size
             return await self.afetch_single_result(
                 endpoint,
                 results_key="results",
-                params=params_with_page_size,
-                headers=headers,
-            )
-
-        if return_metadata:
-            return await self.afetch_all_results_with_metadata(
-                endpoint,
                 params=params,
                 headers=headers,
-                page_size=page_size,
-                max_pages=max_pages,
-                results_key="results",
+                return_metadata=return_metadata,
             )
         return await self.afetch_all_results(
             endpoint,
@@ -258,6 +222,8 @@ class DataAPI(BaseAPIClient):
             page_size=page_size,
             max_pages=max_pages,
             results_key="results",
+            return_metadata=return_metadata,
+            max_concurrent=max_concurrent,
         )
 
     def get_data_by_variable(
@@ -276,29 +242,19 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
+        max_workers: int | None = None,
     ) -> _DataCollectionResult:
-        endpoint = f"data/by-variable/{variable_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_variable_params(
-                years,
-                unit_parent_id,
-                unit_level,
-                aggregate_id,
-                page,
-                extra_query,
-            ),
+        return self._run_data_endpoint(
+            f"data/by-variable/{variable_id}",
+            self._data_by_variable_params(years, unit_parent_id, unit_level, aggregate_id, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return self._fetch_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
             max_pages=max_pages,
             return_metadata=return_metadata,
+            max_workers=max_workers,
         )
 
     def get_data_by_variable_with_metadata(
@@ -311,6 +267,42 @@ class DataAPI(BaseAPIClient):
             self.get_data_by_variable(*args, **kwargs),
         )
 
+    def iter_data_by_variable(
+        self,
+        variable_id: str,
+        years: list[int] | None = None,
+        unit_parent_id: str | None = None,
+        unit_level: int | None = None,
+        aggregate_id: int | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield data rows for a variable as each page arrives instead of collecting them in a list.
+
+        Pages are fetched lazily as the caller consumes rows, so memory stays proportional to
+        the page size rather than the full result set.
+        """
+        params, headers = self._prepare_collection_request(
+            self._data_by_variable_params(years, unit_parent_id, unit_level, aggregate_id, None, extra_query),
+            format=format,
+            lang=lang,
+        )
+        yield from self.fetch_all_results(
+            f"data/by-variable/{variable_id}",
+            params=params,
+            headers=headers,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_workers=max_workers,
+            stream=True,
+        )
+
     def get_data_by_unit(
         self,
         unit_id: str,
@@ -326,19 +318,15 @@ class DataAPI(BaseAPIClient):
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
     ) -> _DataCollectionResult:
-        endpoint = f"data/by-unit/{unit_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_unit_params(variable_ids, years, aggregate_id, page, extra_query),
+        return self._run_data_endpoint(
+            f"data/by-unit/{unit_id}",
+            self._data_by_unit_params(variable_ids, years, aggregate_id, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return self._fetch_single_page_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
+            max_pages=1,
             return_metadata=return_metadata,
         )
 
@@ -350,6 +338,79 @@ class DataAPI(BaseAPIClient):
             self.get_data_by_unit(*args, **kwargs),
         )
 
+    def get_data_by_unit_batch(
+        self,
+        unit_id: str,
+        variable_ids: Sequence[str | int] | str | int | None = None,
+        years: list[int] | None = None,
+        aggregate_id: int | None = None,
+        page_size: int = 100,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        return_metadata: bool = False,
+        chunk_size: int = MAX_VARIABLES_PER_REQUEST,
+        max_workers: int | None = None,
+    ) -> _DataCollectionResult:
+        """
+        Retrieve data for many variables of one unit, fetching up to ``chunk_size`` variables per request.
+
+        Chunks are requested concurrently on up to ``max_workers`` threads (default:
+        ``config.page_concurrency``) and their results concatenated in variable order. With
+        ``return_metadata``, metadata comes from the first chunk and ``totalRecords`` is summed.
+        """
+        chunks = self._variable_chunks(variable_ids, chunk_size)
+
+        def fetch(chunk: list[int]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            return self.get_data_by_unit_with_metadata(
+                unit_id,
+                variable_ids=chunk,
+                years=years,
+                aggregate_id=aggregate_id,
+                page_size=page_size,
+                format=format,
+                lang=lang,
+                extra_query=extra_query,
+            )
+
+        return self._merge_unit_batches(self._map_concurrently(fetch, chunks, max_workers), return_metadata)
+
+    def get_data_by_units(
+        self,
+        unit_ids: Sequence[str],
+        variable_ids: Sequence[str | int] | str | int | None = None,
+        years: list[int] | None = None,
+        aggregate_id: int | None = None,
+        page_size: int = 100,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        return_metadata: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, _DataCollectionResult]:
+        """
+        Retrieve data for the same variables across many units, keyed by unit ID.
+
+        Units are requested concurrently on up to ``max_workers`` threads (default:
+        ``config.page_concurrency``); each entry is what :meth:`get_data_by_unit` returns.
+        """
+        units = list(dict.fromkeys(unit_ids))
+
+        def fetch(unit_id: str) -> _DataCollectionResult:
+            return self.get_data_by_unit(
+                unit_id,
+                variable_ids=variable_ids,
+                years=years,
+                aggregate_id=aggregate_id,
+                page_size=page_size,
+                format=format,
+                lang=lang,
+                extra_query=extra_query,
+                return_metadata=return_metadata,
+            )
+
+        return dict(zip(units, self._map_concurrently(fetch, units, max_workers), strict=True))
+
     def get_data_by_variable_locality(
         self,
         variable_id: str,
@@ -364,22 +425,19 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
+        max_workers: int | None = None,
     ) -> _DataCollectionResult:
-        endpoint = f"data/localities/by-variable/{variable_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_variable_locality_params(unit_parent_id, years, page, extra_query),
+        return self._run_data_endpoint(
+            f"data/localities/by-variable/{variable_id}",
+            self._data_by_variable_locality_params(unit_parent_id, years, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return self._fetch_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
             max_pages=max_pages,
             return_metadata=return_metadata,
+            max_workers=max_workers,
         )
 
     def get_data_by_variable_locality_with_metadata(
@@ -392,6 +450,42 @@ class DataAPI(BaseAPIClient):
             self.get_data_by_variable_locality(*args, **kwargs),
         )
 
+    def get_data_by_variables_locality(
+        self,
+        variable_ids: Sequence[str],
+        unit_parent_id: str,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        return_metadata: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, _DataCollectionResult]:
+        """
+        Retrieve locality data for many variables under one parent unit, keyed by variable ID.
+
+        Variables are requested concurrently on up to ``max_workers`` threads (default:
+        ``config.page_concurrency``); each entry is what :meth:`get_data_by_variable_locality` returns.
+        """
+        variables = list(dict.fromkeys(variable_ids))
+
+        def fetch(variable_id: str) -> _DataCollectionResult:
+            return self.get_data_by_variable_locality(
+                variable_id,
+                unit_parent_id,
+                years=years,
+                page_size=page_size,
+                max_pages=max_pages,
+                format=format,
+                lang=lang,
+                extra_query=extra_query,
+                return_metadata=return_metadata,
+            )
+
+        return dict(zip(variables, self._map_concurrently(fetch, variables, max_workers), strict=True))
+
     def get_data_by_unit_locality(
         self,
         unit_id: str,
@@ -407,28 +501,19 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
+        max_workers: int | None = None,
     ) -> _DataCollectionResult:
-        endpoint = f"data/localities/by-unit/{unit_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_unit_locality_params(
-                variable_ids,
-                years,
-                aggregate_id,
-                page,
-                extra_query,
-            ),
+        return self._run_data_endpoint(
+            f"data/localities/by-unit/{unit_id}",
+            self._data_by_unit_params(variable_ids, years, aggregate_id, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return self._fetch_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
             max_pages=max_pages,
             return_metadata=return_metadata,
+            max_workers=max_workers,
         )
 
     def get_data_by_unit_locality_with_metadata(
@@ -449,7 +534,7 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return self._fetch_detail_endpoint(
+        return self._fetch_metadata_endpoint(
             "data/metadata",
             extra_params=extra_query,
             lang=lang,
@@ -474,29 +559,19 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
+        max_concurrent: int | None = None,
     ) -> _DataCollectionResult:
-        endpoint = f"data/by-variable/{variable_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_variable_params(
-                years,
-                unit_parent_id,
-                unit_level,
-                aggregate_id,
-                page,
-                extra_query,
-            ),
+        return await self._arun_data_endpoint(
+            f"data/by-variable/{variable_id}",
+            self._data_by_variable_params(years, unit_parent_id, unit_level, aggregate_id, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return await self._afetch_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
             max_pages=max_pages,
             return_metadata=return_metadata,
+            max_concurrent=max_concurrent,
         )
 
     async def aget_data_by_variable_with_metadata(
@@ -509,6 +584,39 @@ class DataAPI(BaseAPIClient):
             await self.aget_data_by_variable(*args, **kwargs),
         )
 
+    async def aiter_data_by_variable(
+        self,
+        variable_id: str,
+        years: list[int] | None = None,
+        unit_parent_id: str | None = None,
+        unit_level: int | None = None,
+        aggregate_id: int | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously yield data rows for a variable as each page arrives; see :meth:`iter_data_by_variable`."""
+        params, headers = self._prepare_collection_request(
+            self._data_by_variable_params(years, unit_parent_id, unit_level, aggregate_id, None, extra_query),
+            format=format,
+            lang=lang,
+        )
+        rows = await self.afetch_all_results(
+            f"data/by-variable/{variable_id}",
+            params=params,
+            headers=headers,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_concurrent=max_concurrent,
+            stream=True,
+        )
+        async for row in rows:
+            yield row
+
     async def aget_data_by_unit(
         self,
         unit_id: str,
@@ -524,22 +632,86 @@ class DataAPI(BaseAPIClient):
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
     ) -> _DataCollectionResult:
-        endpoint = f"data/by-unit/{unit_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_unit_params(variable_ids, years, aggregate_id, page, extra_query),
+        """
+        Asynchronously retrieve data for a unit.
+
+        With ``config.unit_batch_window`` set, concurrent calls for the same unit and filters
+        are merged into one request; calls using ``page``, ``extra_query``, conditional headers
+        or ``return_metadata`` are always sent on their own.
+        """
+        if (
+            self.config.unit_batch_window > 0
+            and page is None
+            and not (if_none_match or if_modified_since or extra_query or return_metadata)
+        ):
+            return await self._abatched_data_by_unit(
+                unit_id, self._normalize_variable_ids(variable_ids), years, aggregate_id, page_size, lang, format
+            )
+        return await self._arun_data_endpoint(
+            f"data/by-unit/{unit_id}",
+            self._data_by_unit_params(variable_ids, years, aggregate_id, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return await self._afetch_single_page_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
+            max_pages=1,
             return_metadata=return_metadata,
         )
 
+    async def _abatched_data_by_unit(
+        self,
+        unit_id: str,
+        variable_ids: list[int],
+        years: list[int] | None,
+        aggregate_id: int | None,
+        page_size: int,
+        lang: LanguageLiteral | None,
+        format: FormatLiteral | None,
+    ) -> list[dict[str, Any]]:
+        """Join the pending request for this unit and filters, starting one if none can take the variables."""
+        loop = asyncio.get_running_loop()
+        key = (loop, unit_id, tuple(years or ()), aggregate_id, page_size, lang, format)
+        batch = self._unit_batches.get(key)
+        if batch is None or len(batch.variable_ids.keys() | set(variable_ids)) > MAX_VARIABLES_PER_REQUEST:
+            batch = self._unit_batches[key] = _UnitBatch()
+            batch.flush = loop.create_task(self._aflush_unit_batch(key, batch))
+        batch.variable_ids.update(dict.fromkeys(variable_ids))
+        future: asyncio.Future[list[dict[str, Any]]] = loop.create_future()
+        batch.waiters.append(({str(variable_id) for variable_id in variable_ids}, future))
+        return await future
+
+    async def _aflush_unit_batch(self, key: tuple[Any, ...], batch: _UnitBatch) -> None:
+        """Send a collected batch once the window closes and hand each waiter the rows for its variables."""
+        await asyncio.sleep(self.config.unit_batch_window)
+        if self._unit_batches.get(key) is batch:
+            del self._unit_batches[key]
+        _, unit_id, years, aggregate_id, page_size, lang, format = key
+        try:
+            rows = await self._arun_data_endpoint(
+                f"data/by-unit/{unit_id}",
+                self._data_by_unit_params(list(batch.variable_ids), list(years), aggregate_id, None, None),
+                format=format,
+                lang=lang,
+                if_none_match=None,
+                if_modified_since=None,
+                page_size=max(page_size, len(batch.variable_ids)),
+                max_pages=1,
+                return_metadata=False,
+            )
+        except asyncio.CancelledError:
+            for _, future in batch.waiters:
+                future.cancel()
+            raise
+        except Exception as exc:
+            for _, future in batch.waiters:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for wanted, future in batch.waiters:
+            if not future.done():
+                future.set_result([row for row in cast(list[dict[str, Any]], rows) if str(row.get("id")) in wanted])
+
     async def aget_data_by_unit_with_metadata(
         self, *args: Any, **kwargs: Any
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
@@ -550,6 +722,69 @@ class DataAPI(BaseAPIClient):
             await self.aget_data_by_unit(*args, **kwargs),
         )
 
+    async def aget_data_by_unit_batch(
+        self,
+        unit_id: str,
+        variable_ids: Sequence[str | int] | str | int | None = None,
+        years: list[int] | None = None,
+        aggregate_id: int | None = None,
+        page_size: int = 100,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        return_metadata: bool = False,
+        chunk_size: int = MAX_VARIABLES_PER_REQUEST,
+        max_concurrent: int | None = None,
+    ) -> _DataCollectionResult:
+        """Asynchronously retrieve data for many variables of one unit; see :meth:`get_data_by_unit_batch`."""
+        chunks = self._variable_chunks(variable_ids, chunk_size)
+
+        async def fetch(chunk: list[int]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            return await self.aget_data_by_unit_with_metadata(
+                unit_id,
+                variable_ids=chunk,
+                years=years,
+                aggregate_id=aggregate_id,
+                page_size=page_size,
+                format=format,
+                lang=lang,
+                extra_query=extra_query,
+            )
+
+        batches = await self._amap_concurrently(fetch, chunks, max_concurrent)
+        return self._merge_unit_batches(batches, return_metadata)
+
+    async def aget_data_by_units(
+        self,
+        unit_ids: Sequence[str],
+        variable_ids: Sequence[str | int] | str | int | None = None,
+        years: list[int] | None = None,
+        aggregate_id: int | None = None,
+        page_size: int = 100,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        return_metadata: bool = False,
+        max_concurrent: int | None = None,
+    ) -> dict[str, _DataCollectionResult]:
+        """Asynchronously retrieve data for the same variables across many units; see :meth:`get_data_by_units`."""
+        units = list(dict.fromkeys(unit_ids))
+
+        async def fetch(unit_id: str) -> _DataCollectionResult:
+            return await self.aget_data_by_unit(
+                unit_id,
+                variable_ids=variable_ids,
+                years=years,
+                aggregate_id=aggregate_id,
+                page_size=page_size,
+                format=format,
+                lang=lang,
+                extra_query=extra_query,
+                return_metadata=return_metadata,
+            )
+
+        return dict(zip(units, await self._amap_concurrently(fetch, units, max_concurrent), strict=True))
+
     async def aget_data_by_variable_locality(
         self,
         variable_id: str,
@@ -564,22 +799,19 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
+        max_concurrent: int | None = None,
     ) -> _DataCollectionResult:
-        endpoint = f"data/localities/by-variable/{variable_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_variable_locality_params(unit_parent_id, years, page, extra_query),
+        return await self._arun_data_endpoint(
+            f"data/localities/by-variable/{variable_id}",
+            self._data_by_variable_locality_params(unit_parent_id, years, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return await self._afetch_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
             max_pages=max_pages,
             return_metadata=return_metadata,
+            max_concurrent=max_concurrent,
         )
 
     async def aget_data_by_variable_locality_with_metadata(
@@ -592,6 +824,37 @@ class DataAPI(BaseAPIClient):
             await self.aget_data_by_variable_locality(*args, **kwargs),
         )
 
+    async def aget_data_by_variables_locality(
+        self,
+        variable_ids: Sequence[str],
+        unit_parent_id: str,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        format: FormatLiteral | None = None,
+        lang: LanguageLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        return_metadata: bool = False,
+        max_concurrent: int | None = None,
+    ) -> dict[str, _DataCollectionResult]:
+        """Asynchronously retrieve locality data for many variables; see :meth:`get_data_by_variables_locality`."""
+        variables = list(dict.fromkeys(variable_ids))
+
+        async def fetch(variable_id: str) -> _DataCollectionResult:
+            return await self.aget_data_by_variable_locality(
+                variable_id,
+                unit_parent_id,
+                years=years,
+                page_size=page_size,
+                max_pages=max_pages,
+                format=format,
+                lang=lang,
+                extra_query=extra_query,
+                return_metadata=return_metadata,
+            )
+
+        return dict(zip(variables, await self._amap_concurrently(fetch, variables, max_concurrent), strict=True))
+
     async def aget_data_by_unit_locality(
         self,
         unit_id: str,
@@ -607,28 +870,19 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
         return_metadata: bool = False,
+        max_concurrent: int | None = None,
     ) -> _DataCollectionResult:
-        endpoint = f"data/localities/by-unit/{unit_id}"
-        params, headers = self._prepare_collection_request(
-            extra_params=self._data_by_unit_locality_params(
-                variable_ids,
-                years,
-                aggregate_id,
-                page,
-                extra_query,
-            ),
+        return await self._arun_data_endpoint(
+            f"data/localities/by-unit/{unit_id}",
+            self._data_by_unit_params(variable_ids, years, aggregate_id, page, extra_query),
             format=format,
             lang=lang,
             if_none_match=if_none_match,
             if_modified_since=if_modified_since,
-        )
-        return await self._afetch_data_collection(
-            endpoint,
-            params=params,
-            headers=headers,
             page_size=page_size,
             max_pages=max_pages,
             return_metadata=return_metadata,
+            max_concurrent=max_concurrent,
         )
 
     async def aget_data_by_unit_locality_with_metadata(
@@ -649,7 +903,7 @@ class DataAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return await self._afetch_detail_endpoint(
+        return await self._afetch_metadata_endpoint(
             "data/metadata",
             extra_params=extra_query,
             lang=lang,
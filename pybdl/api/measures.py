@@ -8,12 +8,7 @@ class MeasuresAPI(BaseAPIClient):
 
     @staticmethod
     def _list_params(sort: str | None, extra_query: dict[str, Any] | None) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if sort:
-            params["sort"] = sort
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params({"sort": sort}, extra_query)
 
     def list_measures(
         self,
@@ -63,7 +58,7 @@ class MeasuresAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return self._fetch_detail_endpoint(
+        return self._fetch_metadata_endpoint(
             "measures/metadata",
             extra_params=extra_query,
             lang=lang,
@@ -120,7 +115,7 @@ class MeasuresAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return await self._afetch_detail_endpoint(
+        return await self._afetch_metadata_endpoint(
             "measures/metadata",
             extra_params=extra_query,
             lang=lang,
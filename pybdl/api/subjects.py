@@ -13,16 +13,14 @@ class SubjectsAPI(BaseAPIClient):
         page: int | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if parent_id:
-            params["parent-id"] = parent_id
-        if sort:
-            params["sort"] = sort
-        if page is not None:
-            params["page"] = page
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "parent-id": parent_id,
+                "sort": sort,
+                "page": page,
+            },
+            extra_query,
+        )
 
     @staticmethod
     def _search_params(
@@ -31,14 +29,14 @@ class SubjectsAPI(BaseAPIClient):
         sort: str | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"name": name}
-        if page is not None:
-            params["page"] = page
-        if sort:
-            params["sort"] = sort
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "name": name,
+                "page": page,
+                "sort": sort,
+            },
+            extra_query,
+        )
 
     def list_subjects(
         self,
@@ -116,7 +114,7 @@ class SubjectsAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return self._fetch_detail_endpoint(
+        return self._fetch_metadata_endpoint(
             "subjects/metadata",
             extra_params=extra_query,
             lang=lang,
@@ -201,7 +199,7 @@ class SubjectsAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return await self._afetch_detail_endpoint(
+        return await self._afetch_metadata_endpoint(
             "subjects/metadata",
             extra_params=extra_query,
             lang=lang,
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Sequence
 from typing import Any
 
 from pybdl.api.client import BaseAPIClient, FormatLiteral, LanguageLiteral
@@ -14,18 +15,15 @@ class UnitsAPI(BaseAPIClient):
         sort: str | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if parent_id:
-            params["parent-id"] = parent_id
-        if level:
-            params["level"] = level
-        if page is not None:
-            params["page"] = page
-        if sort:
-            params["sort"] = sort
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "parent-id": parent_id,
+                "level": level,
+                "page": page,
+                "sort": sort,
+            },
+            extra_query,
+        )
 
     @staticmethod
     def _search_units_params(
@@ -37,22 +35,17 @@ class UnitsAPI(BaseAPIClient):
         sort: str | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if name:
-            params["name"] = name
-        if level:
-            params["level"] = level
-        if years:
-            params["year"] = years
-        if kind:
-            params["kind"] = kind
-        if page is not None:
-            params["page"] = page
-        if sort:
-            params["sort"] = sort
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "name": name,
+                "level": level,
+                "year": years,
+                "kind": kind,
+                "page": page,
+                "sort": sort,
+            },
+            extra_query,
+        )
 
     @staticmethod
     def _list_localities_params(
@@ -61,14 +54,14 @@ class UnitsAPI(BaseAPIClient):
         sort: str | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"parent-id": parent_id}
-        if page is not None:
-            params["page"] = page
-        if sort:
-            params["sort"] = sort
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "parent-id": parent_id,
+                "page": page,
+                "sort": sort,
+            },
+            extra_query,
+        )
 
     @staticmethod
     def _search_localities_params(
@@ -78,18 +71,15 @@ class UnitsAPI(BaseAPIClient):
         sort: str | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if name:
-            params["name"] = name
-        if years:
-            params["year"] = years
-        if page is not None:
-            params["page"] = page
-        if sort:
-            params["sort"] = sort
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "name": name,
+                "year": years,
+                "page": page,
+                "sort": sort,
+            },
+            extra_query,
+        )
 
     def list_units(
         self,
@@ -135,6 +125,28 @@ class UnitsAPI(BaseAPIClient):
             if_modified_since=if_modified_since,
         )
 
+    def get_units(
+        self,
+        unit_ids: Sequence[str],
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Retrieve many units by ID, keyed by unit ID.
+
+        The API has no multi-ID lookup, so units are requested concurrently on up to
+        ``max_workers`` threads (default: ``config.page_concurrency``) over the shared
+        connection pool; each entry is what :meth:`get_unit` returns.
+        """
+        units = list(dict.fromkeys(unit_ids))
+
+        def fetch(unit_id: str) -> dict[str, Any]:
+            return self.get_unit(unit_id, lang=lang, format=format, extra_query=extra_query)
+
+        return dict(zip(units, self._map_concurrently(fetch, units, max_workers), strict=True))
+
     def search_units(
         self,
         name: str | None = None,
@@ -188,6 +200,42 @@ class UnitsAPI(BaseAPIClient):
             results_key="results",
         )
 
+    def list_units_and_localities(
+        self,
+        parent_id: str,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        List the units and the localities under a parent unit, returned as ``(units, localities)``.
+
+        Both listings are requested at the same time on worker threads, so the call takes about
+        as long as the slower of :meth:`list_units` and :meth:`list_localities` alone.
+        """
+        calls: list[Callable[[], list[dict[str, Any]]]] = [
+            lambda: self.list_units(
+                parent_id=parent_id,
+                page_size=page_size,
+                max_pages=max_pages,
+                sort=sort,
+                lang=lang,
+                format=format,
+            ),
+            lambda: self.list_localities(
+                parent_id=parent_id,
+                page_size=page_size,
+                max_pages=max_pages,
+                sort=sort,
+                lang=lang,
+                format=format,
+            ),
+        ]
+        units, localities = self._map_concurrently(lambda call: call(), calls, 2)
+        return units, localities
+
     def get_locality(
         self,
         locality_id: str,
@@ -232,6 +280,108 @@ class UnitsAPI(BaseAPIClient):
             results_key="results",
         )
 
+    def iter_units(
+        self,
+        parent_id: str | None = None,
+        level: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Yield units page by page as the caller consumes them instead of collecting a list.
+
+        Only the pages the caller reaches are requested, so stopping early skips the rest and
+        memory stays proportional to the page size. The other ``iter_*`` methods work the same way.
+        """
+        return self._iter_collection_endpoint(
+            "units",
+            extra_params=self._list_units_params(parent_id, level, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_workers=max_workers,
+        )
+
+    def iter_search_units(
+        self,
+        name: str | None = None,
+        level: list[int] | None = None,
+        years: list[int] | None = None,
+        kind: str | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield unit search results page by page; see :meth:`search_units`."""
+        return self._iter_collection_endpoint(
+            "units/search",
+            extra_params=self._search_units_params(name, level, years, kind, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_workers=max_workers,
+        )
+
+    def iter_localities(
+        self,
+        parent_id: str,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield localities page by page; see :meth:`list_localities`."""
+        return self._iter_collection_endpoint(
+            "units/localities",
+            extra_params=self._list_localities_params(parent_id, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_workers=max_workers,
+        )
+
+    def iter_search_localities(
+        self,
+        name: str | None = None,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield locality search results page by page; see :meth:`search_localities`."""
+        return self._iter_collection_endpoint(
+            "units/localities/search",
+            extra_params=self._search_localities_params(name, years, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_workers=max_workers,
+        )
+
     def get_units_metadata(
         self,
         lang: LanguageLiteral | None = None,
@@ -240,7 +390,7 @@ class UnitsAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return self._fetch_detail_endpoint(
+        return self._fetch_metadata_endpoint(
             "units/metadata",
             extra_params=extra_query,
             lang=lang,
@@ -293,6 +443,22 @@ class UnitsAPI(BaseAPIClient):
             if_modified_since=if_modified_since,
         )
 
+    async def aget_units(
+        self,
+        unit_ids: Sequence[str],
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Asynchronously retrieve many units by ID with bounded concurrency; see :meth:`get_units`."""
+        units = list(dict.fromkeys(unit_ids))
+
+        async def fetch(unit_id: str) -> dict[str, Any]:
+            return await self.aget_unit(unit_id, lang=lang, format=format, extra_query=extra_query)
+
+        return dict(zip(units, await self._amap_concurrently(fetch, units, max_concurrent), strict=True))
+
     async def asearch_units(
         self,
         name: str | None = None,
@@ -346,6 +512,37 @@ class UnitsAPI(BaseAPIClient):
             results_key="results",
         )
 
+    async def alist_units_and_localities(
+        self,
+        parent_id: str,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Asynchronously list the units and localities under a parent unit; see :meth:`list_units_and_localities`."""
+        calls: list[Callable[[], Awaitable[list[dict[str, Any]]]]] = [
+            lambda: self.alist_units(
+                parent_id=parent_id,
+                page_size=page_size,
+                max_pages=max_pages,
+                sort=sort,
+                lang=lang,
+                format=format,
+            ),
+            lambda: self.alist_localities(
+                parent_id=parent_id,
+                page_size=page_size,
+                max_pages=max_pages,
+                sort=sort,
+                lang=lang,
+                format=format,
+            ),
+        ]
+        units, localities = await self._amap_concurrently(lambda call: call(), calls, 2)
+        return units, localities
+
     async def aget_locality(
         self,
         locality_id: str,
@@ -390,6 +587,107 @@ class UnitsAPI(BaseAPIClient):
             results_key="results",
         )
 
+    async def aiter_units(
+        self,
+        parent_id: str | None = None,
+        level: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously yield units page by page as the caller consumes them; see :meth:`iter_units`."""
+        async for row in self._aiter_collection_endpoint(
+            "units",
+            extra_params=self._list_units_params(parent_id, level, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_concurrent=max_concurrent,
+        ):
+            yield row
+
+    async def aiter_search_units(
+        self,
+        name: str | None = None,
+        level: list[int] | None = None,
+        years: list[int] | None = None,
+        kind: str | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously yield unit search results page by page; see :meth:`iter_search_units`."""
+        async for row in self._aiter_collection_endpoint(
+            "units/search",
+            extra_params=self._search_units_params(name, level, years, kind, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_concurrent=max_concurrent,
+        ):
+            yield row
+
+    async def aiter_localities(
+        self,
+        parent_id: str,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously yield localities page by page; see :meth:`iter_localities`."""
+        async for row in self._aiter_collection_endpoint(
+            "units/localities",
+            extra_params=self._list_localities_params(parent_id, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_concurrent=max_concurrent,
+        ):
+            yield row
+
+    async def aiter_search_localities(
+        self,
+        name: str | None = None,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously yield locality search results page by page; see :meth:`iter_search_localities`."""
+        async for row in self._aiter_collection_endpoint(
+            "units/localities/search",
+            extra_params=self._search_localities_params(name, years, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_concurrent=max_concurrent,
+        ):
+            yield row
+
     async def aget_units_metadata(
         self,
         lang: LanguageLiteral | None = None,
@@ -398,7 +696,7 @@ class UnitsAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return await self._afetch_detail_endpoint(
+        return await self._afetch_metadata_endpoint(
             "units/metadata",
             extra_params=extra_query,
             lang=lang,
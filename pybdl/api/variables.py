@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator, Generator
 from typing import Any
 
 from pybdl.api.client import BaseAPIClient, FormatLiteral, LanguageLiteral
@@ -15,20 +16,16 @@ class VariablesAPI(BaseAPIClient):
         sort: str | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if subject_id:
-            params["subject-id"] = subject_id
-        if level is not None:
-            params["level"] = level
-        if years:
-            params["year"] = years
-        if page is not None:
-            params["page"] = page
-        if sort:
-            params["sort"] = sort
-        if extra_query:
-            params.update(extra_query)
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "subject-id": subject_id,
+                "level": level,
+                "year": years,
+                "page": page,
+                "sort": sort,
+            },
+            extra_query,
+        )
 
     @staticmethod
     def _search_params(
@@ -40,10 +37,17 @@ class VariablesAPI(BaseAPIClient):
         sort: str | None,
         extra_query: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        params = VariablesAPI._list_params(subject_id, level, years, page, sort, extra_query)
-        if name:
-            params["name"] = name
-        return params
+        return BaseAPIClient._assemble_params(
+            {
+                "name": name,
+                "subject-id": subject_id,
+                "level": level,
+                "year": years,
+                "page": page,
+                "sort": sort,
+            },
+            extra_query,
+        )
 
     def list_variables(
         self,
@@ -118,6 +122,57 @@ class VariablesAPI(BaseAPIClient):
             results_key="results",
         )
 
+    def iter_variables(
+        self,
+        subject_id: str | None = None,
+        level: int | None = None,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield variables page by page as the caller consumes them; see :meth:`list_variables`."""
+        return self._iter_collection_endpoint(
+            "variables",
+            extra_params=self._list_params(subject_id, level, years, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_workers=max_workers,
+        )
+
+    def iter_search_variables(
+        self,
+        name: str | None = None,
+        subject_id: str | None = None,
+        level: int | None = None,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield variable search results page by page; see :meth:`search_variables`."""
+        return self._iter_collection_endpoint(
+            "variables/search",
+            extra_params=self._search_params(name, subject_id, level, years, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_workers=max_workers,
+        )
+
     def get_variables_metadata(
         self,
         lang: LanguageLiteral | None = None,
@@ -126,7 +181,7 @@ class VariablesAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return self._fetch_detail_endpoint(
+        return self._fetch_metadata_endpoint(
             "variables/metadata",
             extra_params=extra_query,
             lang=lang,
@@ -208,6 +263,59 @@ class VariablesAPI(BaseAPIClient):
             results_key="results",
         )
 
+    async def aiter_variables(
+        self,
+        subject_id: str | None = None,
+        level: int | None = None,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously yield variables page by page; see :meth:`iter_variables`."""
+        async for row in self._aiter_collection_endpoint(
+            "variables",
+            extra_params=self._list_params(subject_id, level, years, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_concurrent=max_concurrent,
+        ):
+            yield row
+
+    async def aiter_search_variables(
+        self,
+        name: str | None = None,
+        subject_id: str | None = None,
+        level: int | None = None,
+        years: list[int] | None = None,
+        page_size: int = 100,
+        max_pages: int | None = None,
+        sort: str | None = None,
+        lang: LanguageLiteral | None = None,
+        format: FormatLiteral | None = None,
+        extra_query: dict[str, Any] | None = None,
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronously yield variable search results page by page; see :meth:`iter_search_variables`."""
+        async for row in self._aiter_collection_endpoint(
+            "variables/search",
+            extra_params=self._search_params(name, subject_id, level, years, None, sort, extra_query),
+            lang=lang,
+            format=format,
+            page_size=page_size,
+            max_pages=max_pages,
+            results_key="results",
+            max_concurrent=max_concurrent,
+        ):
+            yield row
+
     async def aget_variables_metadata(
         self,
         lang: LanguageLiteral | None = None,
@@ -216,7 +324,7 @@ class VariablesAPI(BaseAPIClient):
         if_modified_since: str | None = None,
         extra_query: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return await self._afetch_detail_endpoint(
+        return await self._afetch_metadata_endpoint(
             "variables/metadata",
             extra_params=extra_query,
             lang=lang,
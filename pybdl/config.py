@@ -29,6 +29,12 @@ DEFAULT_LANGUAGE = Language.EN
 DEFAULT_FORMAT = Format.JSON
 DEFAULT_CACHE_EXPIRY = 3600  # 1 hour in seconds
 DEFAULT_PAGE_SIZE = 100
+DEFAULT_PAGE_CONCURRENCY = 4
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_CONDITIONAL_CACHE_SIZE = 256
+DEFAULT_METADATA_CACHE_TTL = 900.0  # 15 minutes
+DEFAULT_UNIT_BATCH_WINDOW = 0.0  # disabled
 DEFAULT_REQUEST_RETRIES = 3
 DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
 DEFAULT_MAX_RETRY_DELAY = 30.0
@@ -73,6 +79,20 @@ class BDLConfig:
         quota_cache_file: Path to quota cache file (default: project .cache/pybdl).
         use_global_cache: Store quota cache in OS-specific location (default: False).
         page_size: Default page size for paginated requests (default: 100).
+        page_concurrency: Maximum number of pages fetched concurrently once the total page count
+            is known from the first page (default: 4). Set to 1 to fetch pages one at a time.
+        max_connections: Maximum number of open connections per HTTP client (default: 100).
+        max_keepalive_connections: Maximum number of idle connections kept alive for reuse
+            per HTTP client (default: 20).
+        conditional_cache_size: Number of responses whose ``ETag`` / ``Last-Modified``
+            validators and payloads are kept for conditional requests when HTTP caching is
+            disabled (default: 256). Set to 0 to turn conditional requests off.
+        metadata_cache_ttl: Seconds for which results of the ``*_metadata`` endpoints (for example
+            ``get_data_metadata``) are reused in process without a request (default: 900). Set to 0
+            to always request them.
+        unit_batch_window: Seconds for which concurrent ``DataAPI.aget_data_by_unit`` calls for
+            the same unit and filters are collected and sent as one request with their
+            ``var-id`` lists merged (default: 0, disabled).
         request_retries: Number of retry attempts for transient HTTP errors (default: 3).
         retry_backoff_factor: Base backoff factor in seconds for retries (default: 0.5).
         max_retry_delay: Maximum time to wait between retries in seconds (default: 30).
@@ -99,6 +119,12 @@ class BDLConfig:
     quota_cache_file: str | None
     use_global_cache: bool
     page_size: int
+    page_concurrency: int
+    max_connections: int
+    max_keepalive_connections: int
+    conditional_cache_size: int
+    metadata_cache_ttl: float
+    unit_batch_window: float
     request_retries: int
     retry_backoff_factor: float
     max_retry_delay: float
@@ -124,6 +150,12 @@ class BDLConfig:
         quota_cache_file: str | None | object = _NOT_PROVIDED,
         use_global_cache: bool | object = _NOT_PROVIDED,
         page_size: int | object = _NOT_PROVIDED,
+        page_concurrency: int | object = _NOT_PROVIDED,
+        max_connections: int | object = _NOT_PROVIDED,
+        max_keepalive_connections: int | object = _NOT_PROVIDED,
+        conditional_cache_size: int | object = _NOT_PROVIDED,
+        metadata_cache_ttl: float | object = _NOT_PROVIDED,
+        unit_batch_window: float | object = _NOT_PROVIDED,
         request_retries: int | object = _NOT_PROVIDED,
         retry_backoff_factor: float | object = _NOT_PROVIDED,
         max_retry_delay: float | object = _NOT_PROVIDED,
@@ -149,6 +181,12 @@ class BDLConfig:
                 "quota_cache_file": quota_cache_file,
                 "use_global_cache": use_global_cache,
                 "page_size": page_size,
+                "page_concurrency": page_concurrency,
+                "max_connections": max_connections,
+                "max_keepalive_connections": max_keepalive_connections,
+                "conditional_cache_size": conditional_cache_size,
+                "metadata_cache_ttl": metadata_cache_ttl,
+                "unit_batch_window": unit_batch_window,
                 "request_retries": request_retries,
                 "retry_backoff_factor": retry_backoff_factor,
                 "max_retry_delay": max_retry_delay,
@@ -197,6 +235,42 @@ class BDLConfig:
             False,
         )
         self.page_size = self._resolve_int("page_size", page_size, "BDL_PAGE_SIZE", DEFAULT_PAGE_SIZE)
+        self.page_concurrency = self._resolve_int(
+            "page_concurrency",
+            page_concurrency,
+            "BDL_PAGE_CONCURRENCY",
+            DEFAULT_PAGE_CONCURRENCY,
+        )
+        self.max_connections = self._resolve_int(
+            "max_connections",
+            max_connections,
+            "BDL_MAX_CONNECTIONS",
+            DEFAULT_MAX_CONNECTIONS,
+        )
+        self.max_keepalive_connections = self._resolve_int(
+            "max_keepalive_connections",
+            max_keepalive_connections,
+            "BDL_MAX_KEEPALIVE_CONNECTIONS",
+            DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        )
+        self.conditional_cache_size = self._resolve_int(
+            "conditional_cache_size",
+            conditional_cache_size,
+            "BDL_CONDITIONAL_CACHE_SIZE",
+            DEFAULT_CONDITIONAL_CACHE_SIZE,
+        )
+        self.metadata_cache_ttl = self._resolve_float(
+            "metadata_cache_ttl",
+            metadata_cache_ttl,
+            "BDL_METADATA_CACHE_TTL",
+            DEFAULT_METADATA_CACHE_TTL,
+        )
+        self.unit_batch_window = self._resolve_float(
+            "unit_batch_window",
+            unit_batch_window,
+            "BDL_UNIT_BATCH_WINDOW",
+            DEFAULT_UNIT_BATCH_WINDOW,
+        )
         self.request_retries = self._resolve_int(
             "request_retries",
             request_retries,
@@ -238,6 +312,18 @@ class BDLConfig:
 
         if self.page_size <= 0:
             raise ValueError("page_size must be a positive integer")
+        if self.page_concurrency <= 0:
+            raise ValueError("page_concurrency must be a positive integer")
+        if self.max_connections <= 0:
+            raise ValueError("max_connections must be a positive integer")
+        if self.max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections must be greater than or equal to 0")
+        if self.conditional_cache_size < 0:
+            raise ValueError("conditional_cache_size must be greater than or equal to 0")
+        if self.metadata_cache_ttl < 0:
+            raise ValueError("metadata_cache_ttl must be greater than or equal to 0")
+        if self.unit_batch_window < 0:
+            raise ValueError("unit_batch_window must be greater than or equal to 0")
         if self.cache_expire_after < 0:
             raise ValueError("cache_expire_after must be greater than or equal to 0")
         if self.request_retries < 0:
@@ -1,12 +1,29 @@
 """HTTP response caching (hishel + httpx)."""
 
-from pybdl.utils.http_cache.client_factory import build_async_http_client, build_sync_http_client
+from pybdl.utils.http_cache.client_factory import build_async_http_client, build_sync_http_client, connection_limits
+from pybdl.utils.http_cache.conditional import ConditionalRequestCache
+from pybdl.utils.http_cache.decoded import DecodedResponseCache
 from pybdl.utils.http_cache.paths import resolve_http_cache_db_path
 from pybdl.utils.http_cache.response import is_from_http_cache
+from pybdl.utils.http_cache.shared import (
+    acquire_shared_async_http_client,
+    acquire_shared_sync_http_client,
+    forget_shared_async_http_client,
+    release_shared_async_http_client,
+    release_shared_sync_http_client,
+)
 
 __all__ = [
+    "ConditionalRequestCache",
+    "DecodedResponseCache",
+    "acquire_shared_async_http_client",
+    "acquire_shared_sync_http_client",
     "build_async_http_client",
     "build_sync_http_client",
+    "connection_limits",
+    "forget_shared_async_http_client",
     "is_from_http_cache",
+    "release_shared_async_http_client",
+    "release_shared_sync_http_client",
     "resolve_http_cache_db_path",
 ]
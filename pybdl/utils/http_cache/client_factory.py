@@ -1,41 +1,77 @@
 """Construct httpx clients with optional hishel HTTP caching."""
 
+import sqlite3
 from collections.abc import Mapping
+from importlib.util import find_spec
 from pathlib import Path
 
+import anysqlite
 import httpx
 from hishel import AsyncSqliteStorage, FilterPolicy, SyncSqliteStorage
 from hishel.httpx import AsyncCacheClient, SyncCacheClient
 
-from pybdl.config import CacheBackend
+from pybdl.config import DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS, CacheBackend
+
+
+def http2_available() -> bool:
+    """Return True when the optional ``h2`` package needed by httpx for HTTP/2 is installed."""
+    return find_spec("h2") is not None
+
+
+# Keep idle connections around long enough to survive rate-limiter waits between pages.
+KEEPALIVE_EXPIRY = 30.0
+
+
+def connection_limits(max_connections: int, max_keepalive_connections: int) -> httpx.Limits:
+    """Return connection pool limits with the shared keep-alive expiry."""
+    return httpx.Limits(
+        max_keepalive_connections=max_keepalive_connections,
+        max_connections=max_connections,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+CONNECTION_LIMITS = connection_limits(DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
 
 
 def _cache_policy() -> FilterPolicy:
     return FilterPolicy()
 
 
+def _memory_connection() -> sqlite3.Connection:
+    # hishel treats ``database_path`` as a file name inside its cache directory, so
+    # ``":memory:"`` would create a file literally named that. Hand it an open connection.
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
 def build_sync_http_client(
     *,
     cache_backend: CacheBackend | None,
     http_cache_db_path: Path | None,
     default_headers: Mapping[str, str],
     proxy: str | None,
+    cache_ttl: float | None = None,
+    limits: httpx.Limits = CONNECTION_LIMITS,
 ) -> httpx.Client:
     if cache_backend == "memory":
         return SyncCacheClient(
             headers=default_headers,
             proxy=proxy,
-            storage=SyncSqliteStorage(database_path=":memory:"),
+            limits=limits,
+            http2=http2_available(),
+            storage=SyncSqliteStorage(connection=_memory_connection(), default_ttl=cache_ttl),
             policy=_cache_policy(),
         )
     if cache_backend == "file" and http_cache_db_path is not None:
         return SyncCacheClient(
             headers=default_headers,
             proxy=proxy,
-            storage=SyncSqliteStorage(database_path=str(http_cache_db_path)),
+            limits=limits,
+            http2=http2_available(),
+            storage=SyncSqliteStorage(database_path=str(http_cache_db_path), default_ttl=cache_ttl),
             policy=_cache_policy(),
         )
-    return httpx.Client(headers=default_headers, proxy=proxy)
+    return httpx.Client(headers=default_headers, proxy=proxy, limits=limits, http2=http2_available())
 
 
 def build_async_http_client(
@@ -44,19 +80,25 @@ def build_async_http_client(
     http_cache_db_path: Path | None,
     default_headers: Mapping[str, str],
     proxy: str | None,
+    cache_ttl: float | None = None,
+    limits: httpx.Limits = CONNECTION_LIMITS,
 ) -> httpx.AsyncClient:
     if cache_backend == "memory":
         return AsyncCacheClient(
             headers=default_headers,
             proxy=proxy,
-            storage=AsyncSqliteStorage(database_path=":memory:"),
+            limits=limits,
+            http2=http2_available(),
+            storage=AsyncSqliteStorage(connection=anysqlite.Connection(_memory_connection()), default_ttl=cache_ttl),
             policy=_cache_policy(),
         )
     if cache_backend == "file" and http_cache_db_path is not None:
         return AsyncCacheClient(
             headers=default_headers,
             proxy=proxy,
-            storage=AsyncSqliteStorage(database_path=str(http_cache_db_path)),
+            limits=limits,
+            http2=http2_available(),
+            storage=AsyncSqliteStorage(database_path=str(http_cache_db_path), default_ttl=cache_ttl),
             policy=_cache_policy(),
         )
-    return httpx.AsyncClient(headers=default_headers, proxy=proxy)
+    return httpx.AsyncClient(headers=default_headers, proxy=proxy, limits=limits, http2=http2_available())
@@ -0,0 +1,80 @@
+"""Validator store for conditional requests when the HTTP cache is disabled."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import httpx
+
+from pybdl.config import DEFAULT_CONDITIONAL_CACHE_SIZE
+
+
+class _Validated(NamedTuple):
+    etag: str | None
+    last_modified: str | None
+    data: dict[str, Any]
+
+
+def _cache_key(url: httpx.URL | str) -> str:
+    """Key a URL with its query parameters sorted, so parameter order does not split entries."""
+    url = httpx.URL(url)
+    if not url.query:
+        return str(url)
+    return str(url.copy_with(params=sorted(url.params.multi_items())))
+
+
+class ConditionalRequestCache:
+    """
+    Bounded LRU of response validators and decoded payloads keyed by request URL and query.
+
+    Used when hishel is not in play: a later GET for the same URL is sent with
+    ``If-None-Match`` / ``If-Modified-Since`` and a ``304 Not Modified`` answer is resolved to
+    the stored payload without transferring or parsing the body again. Stored payloads are
+    shared and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CONDITIONAL_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, _Validated] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validators(self, url: httpx.URL | str) -> dict[str, str]:
+        """Return conditional request headers for a URL, or an empty dict if nothing is stored."""
+        with self._lock:
+            entry = self._entries.get(_cache_key(url))
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def get(self, response: httpx.Response) -> dict[str, Any] | None:
+        """Return the stored payload for a ``304 Not Modified`` response, if any."""
+        key = _cache_key(response.request.url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry.data
+
+    def put(self, response: httpx.Response, data: dict[str, Any]) -> None:
+        """Remember the payload of a response that carries an ``ETag`` or ``Last-Modified`` header."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (etag is None and last_modified is None) or self.maxsize <= 0:
+            return
+        key = _cache_key(response.request.url)
+        with self._lock:
+            self._entries[key] = _Validated(etag, last_modified, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every stored entry."""
+        with self._lock:
+            self._entries.clear()
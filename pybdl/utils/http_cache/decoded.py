@@ -0,0 +1,63 @@
+"""In-process memo of decoded JSON bodies for responses served from the HTTP cache."""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+
+from pybdl.utils.http_cache.response import is_from_http_cache
+
+DEFAULT_DECODED_CACHE_SIZE = 256
+
+
+class DecodedResponseCache:
+    """
+    Bounded LRU of decoded JSON payloads keyed by HTTP cache entry.
+
+    hishel stores raw response bytes, so every cache hit would otherwise be parsed again.
+    Entries are keyed by request URL and the cache entry's creation time, so a refreshed
+    entry never reuses a payload decoded from an older one. Only responses served from the
+    HTTP cache are memoized; the stored payloads are shared and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_DECODED_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, float], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(response: httpx.Response) -> tuple[str, float] | None:
+        if not is_from_http_cache(response):
+            return None
+        created_at = response.extensions.get("hishel_created_at")
+        if not isinstance(created_at, int | float):
+            return None
+        return str(response.request.url), float(created_at)
+
+    def get(self, response: httpx.Response) -> dict[str, Any] | None:
+        """Return the memoized payload for a cached response, if any."""
+        key = self._key(response)
+        if key is None:
+            return None
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, response: httpx.Response, data: dict[str, Any]) -> None:
+        """Remember the decoded payload of a response served from cache."""
+        key = self._key(response)
+        if key is None or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every memoized payload."""
+        with self._lock:
+            self._entries.clear()
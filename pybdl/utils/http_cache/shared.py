@@ -0,0 +1,167 @@
+"""Process-wide sharing of HTTP clients between API clients."""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+import httpx
+
+from pybdl.config import CacheBackend
+from pybdl.utils.http_cache.client_factory import CONNECTION_LIMITS, build_async_http_client, build_sync_http_client
+
+_ClientT = TypeVar("_ClientT", httpx.Client, httpx.AsyncClient)
+
+
+@dataclass
+class _SharedClient(Generic[_ClientT]):
+    client: _ClientT
+    refs: int = 0
+
+
+_lock = threading.Lock()
+_shared: dict[tuple[Any, ...], _SharedClient[httpx.Client]] = {}
+# Async connections belong to the event loop that opened them, so async clients are shared per loop.
+_SharedAsyncClients = dict[tuple[Any, ...], _SharedClient[httpx.AsyncClient]]
+_shared_async: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedAsyncClients] = weakref.WeakKeyDictionary()
+
+
+def _client_key(
+    cache_backend: CacheBackend | None,
+    http_cache_db_path: Path | None,
+    default_headers: Mapping[str, str],
+    proxy: str | None,
+    cache_ttl: float | None,
+    limits: httpx.Limits,
+) -> tuple[Any, ...]:
+    return (
+        cache_backend,
+        http_cache_db_path,
+        tuple(sorted((key.lower(), value) for key, value in default_headers.items())),
+        proxy,
+        cache_ttl,
+        (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry),
+    )
+
+
+def acquire_shared_sync_http_client(
+    *,
+    cache_backend: CacheBackend | None,
+    http_cache_db_path: Path | None,
+    default_headers: Mapping[str, str],
+    proxy: str | None,
+    cache_ttl: float | None = None,
+    limits: httpx.Limits = CONNECTION_LIMITS,
+) -> httpx.Client:
+    """
+    Return a sync HTTP client shared by every caller with the same settings.
+
+    Sharing one client lets API clients in the same process reuse pooled connections and,
+    for the ``memory`` backend, one HTTP cache. Each acquisition must be paired with
+    :func:`release_shared_sync_http_client`; the client is closed once the last holder
+    releases it.
+    """
+    key = _client_key(cache_backend, http_cache_db_path, default_headers, proxy, cache_ttl, limits)
+    with _lock:
+        entry = _shared.get(key)
+        if entry is None or entry.client.is_closed:
+            entry = _SharedClient(
+                build_sync_http_client(
+                    cache_backend=cache_backend,
+                    http_cache_db_path=http_cache_db_path,
+                    default_headers=default_headers,
+                    proxy=proxy,
+                    cache_ttl=cache_ttl,
+                    limits=limits,
+                )
+            )
+            _shared[key] = entry
+        entry.refs += 1
+        return entry.client
+
+
+def release_shared_sync_http_client(client: httpx.Client) -> None:
+    """Drop one reference to a shared client, closing it when no holders remain."""
+    with _lock:
+        for key, entry in _shared.items():
+            if entry.client is client:
+                entry.refs -= 1
+                if entry.refs > 0:
+                    return
+                del _shared[key]
+                break
+    client.close()
+
+
+def acquire_shared_async_http_client(
+    *,
+    cache_backend: CacheBackend | None,
+    http_cache_db_path: Path | None,
+    default_headers: Mapping[str, str],
+    proxy: str | None,
+    cache_ttl: float | None = None,
+    limits: httpx.Limits = CONNECTION_LIMITS,
+) -> httpx.AsyncClient:
+    """
+    Return an async HTTP client shared by every caller on the running event loop with the same settings.
+
+    Each acquisition must be paired with :func:`release_shared_async_http_client` (or
+    :func:`forget_shared_async_http_client` once the loop is gone). Outside a running event
+    loop a private client is returned.
+    """
+    settings: dict[str, Any] = {
+        "cache_backend": cache_backend,
+        "http_cache_db_path": http_cache_db_path,
+        "default_headers": default_headers,
+        "proxy": proxy,
+        "cache_ttl": cache_ttl,
+        "limits": limits,
+    }
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return build_async_http_client(**settings)
+
+    key = _client_key(cache_backend, http_cache_db_path, default_headers, proxy, cache_ttl, limits)
+    with _lock:
+        clients = _shared_async.setdefault(loop, {})
+        entry = clients.get(key)
+        if entry is None or entry.client.is_closed:
+            entry = _SharedClient(build_async_http_client(**settings))
+            clients[key] = entry
+        entry.refs += 1
+        return entry.client
+
+
+def _drop_shared_async_http_client(client: httpx.AsyncClient) -> tuple[bool, asyncio.AbstractEventLoop | None]:
+    """Drop one reference; return whether the client is now unused and the loop it was shared on."""
+    with _lock:
+        for loop, clients in list(_shared_async.items()):
+            for key, entry in clients.items():
+                if entry.client is client:
+                    entry.refs -= 1
+                    if entry.refs > 0:
+                        return False, loop
+                    del clients[key]
+                    return True, loop
+    return True, None
+
+
+async def release_shared_async_http_client(client: httpx.AsyncClient) -> None:
+    """
+    Drop one reference to a shared async client, closing it when no holders remain.
+
+    A client that belongs to another event loop is dropped without being closed, since its
+    connections can only be closed on that loop.
+    """
+    unused, loop = _drop_shared_async_http_client(client)
+    if unused and (loop is None or loop is asyncio.get_running_loop()):
+        await client.aclose()
+
+
+def forget_shared_async_http_client(client: httpx.AsyncClient) -> None:
+    """Drop one reference to a shared async client without closing it, e.g. after its event loop has finished."""
+    _drop_shared_async_http_client(client)
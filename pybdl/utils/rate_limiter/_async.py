@@ -48,6 +48,32 @@ class AsyncRateLimiter(RateLimiterBase):
             if sleep_time > 0:
                 await asyncio.sleep(sleep_time)
 
+    async def acquire_many(self, count: int) -> list[float | None]:
+        """
+        Reserve ``count`` calls at once, waiting until all of them fit in every quota.
+
+        The reservations are recorded under a single lock and a single quota cache write;
+        each returned timestamp can be passed to :meth:`release` individually.
+        """
+        if not self.quotas:
+            return [None] * count
+        self._check_batch_size(count)
+
+        while True:
+            sleep_time = 0.0
+            async with self.lock:
+                if self.cache and self.cache.enabled:
+                    self._sync_from_cache()
+                now = self._now()
+                self._cleanup_expired(now)
+                wait_time = self._compute_wait(now, count)
+                if wait_time <= 0 and self._try_record(now, count):
+                    return [now] * count
+                sleep_time = self._check_wait_and_raise(wait_time) if wait_time > 0 else 0.0
+
+            if sleep_time > 0:
+                await asyncio.sleep(sleep_time)
+
     async def release(self, recorded_at: float | None) -> None:
         if recorded_at is None:
             return
@@ -86,14 +86,30 @@ class RateLimiterBase:
                 valid = list(q)
             self.calls[period] = deque(valid)
 
-    def _compute_wait(self, now: float) -> float:
+    def _compute_wait(self, now: float, count: int = 1) -> float:
         max_wait = 0.0
         for period, q in self.calls.items():
             limit = self._get_limit(period)
-            if len(q) >= limit:
-                max_wait = max(max_wait, period - (now - q[0]))
+            if len(q) + count > limit:
+                # The oldest timestamps that must expire before ``count`` slots are free.
+                index = min(len(q) - 1, len(q) + count - limit - 1)
+                max_wait = max(max_wait, period - (now - q[index]))
         return max_wait
 
+    @property
+    def max_batch_size(self) -> int | None:
+        """Largest number of calls ``acquire_many`` can reserve at once (None when unlimited)."""
+        if not self.quotas:
+            return None
+        return min(self._get_limit(period) for period in self.quotas)
+
+    def _check_batch_size(self, count: int) -> None:
+        if count < 1:
+            raise ValueError("count must be a positive integer")
+        largest = self.max_batch_size
+        if largest is not None and count > largest:
+            raise ValueError(f"Cannot reserve {count} calls at once; the tightest quota allows {largest}")
+
     def _seconds_until_available_at(self, now: float) -> float:
         """Seconds until a quota slot is available (0 if immediate). Includes buffer_seconds."""
         self._cleanup_expired(now)
@@ -124,15 +140,15 @@ class RateLimiterBase:
     def _cache_keys(self) -> list[str]:
         return [f"{self.cache_key}_{period}" for period in self.quotas]
 
-    def _try_record(self, now: float) -> bool:
+    def _try_record(self, now: float, count: int = 1) -> bool:
         if self.cache and self.cache.enabled:
-            success = self.cache.try_record_all_periods(self._cache_period_configs(), now)
+            success = self.cache.try_record_all_periods(self._cache_period_configs(), now, count=count)
             self._sync_from_cache(merge=False)
             self._cleanup_expired(now)
             return success
 
         for period in self.quotas:
-            self.calls[period].append(now)
+            self.calls[period].extend([now] * count)
         return True
 
     def _remove_local_timestamp(self, period: int, recorded_at: float) -> None:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import contextlib
-import json
 import sys
 import threading
 from collections.abc import Generator, Sequence
@@ -11,11 +10,16 @@ from pathlib import Path
 from typing import Any
 
 from pybdl.utils.cache import resolve_cache_file_path
+from pybdl.utils.jsonlib import dumps as json_dumps
+from pybdl.utils.jsonlib import loads as json_loads
 
 
 class PersistentQuotaCache:
     """Thread-safe persistent storage for rate limiter timestamps."""
 
+    _shared_instances: dict[Path, PersistentQuotaCache] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(
         self,
         enabled: bool = True,
@@ -38,6 +42,39 @@ class PersistentQuotaCache:
             with self._interprocess_lock():
                 pass
 
+    @classmethod
+    def shared(
+        cls,
+        enabled: bool = True,
+        *,
+        cache_file: str | Path | None = None,
+        use_global_cache: bool = False,
+    ) -> PersistentQuotaCache:
+        """
+        Return the process-wide cache instance for a quota file.
+
+        Clients pointing at the same file reuse one instance, so they share its in-process
+        lock and the lock file is only prepared once. Disabled caches hold no state and are
+        never shared.
+        """
+        if not enabled:
+            return cls(False, cache_file=cache_file, use_global_cache=use_global_cache)
+        path = Path(
+            resolve_cache_file_path(
+                "quota_cache.json",
+                use_global_cache=use_global_cache,
+                custom_file=str(cache_file) if cache_file is not None else None,
+            )
+        ).resolve()
+        instance = cls._shared_instances.get(path)
+        if instance is None:
+            with cls._shared_lock:
+                instance = cls._shared_instances.get(path)
+                if instance is None:
+                    instance = cls(True, cache_file=path)
+                    cls._shared_instances[path] = instance
+        return instance
+
     def _cache_path(self) -> Path:
         return Path(self.cache_file)
 
@@ -99,9 +136,8 @@ class PersistentQuotaCache:
         try:
             cache_path = self._cache_path()
             if cache_path.exists():
-                with cache_path.open(encoding="utf-8") as handle:
-                    self._data = json.load(handle)
-        except (json.JSONDecodeError, OSError):
+                self._data = json_loads(cache_path.read_bytes())
+        except (ValueError, OSError):
             self._data = {}
 
     @staticmethod
@@ -116,8 +152,7 @@ class PersistentQuotaCache:
         try:
             cache_path = self._cache_path()
             temp_file = cache_path.with_suffix(".tmp")
-            with temp_file.open("w", encoding="utf-8") as handle:
-                json.dump(self._data, handle)
+            temp_file.write_bytes(json_dumps(self._data))
             temp_file.replace(cache_path)
         except OSError:
             pass
@@ -200,8 +235,9 @@ class PersistentQuotaCache:
         self,
         periods_config: Sequence[tuple[str, int, int]],
         value: float,
+        count: int = 1,
     ) -> bool:
-        """Atomically record one timestamp for every tracked period."""
+        """Atomically record ``count`` copies of a timestamp for every tracked period."""
         if not self.enabled:
             return True
 
@@ -209,12 +245,12 @@ class PersistentQuotaCache:
             staged: dict[str, list[float]] = {}
             for key, max_length, period in periods_config:
                 current = self._clean_list(key, period=period)
-                if len(current) >= max_length:
+                if len(current) + count > max_length:
                     return False
                 staged[key] = current
 
             for key, _, _ in periods_config:
-                staged[key].append(value)
+                staged[key].extend([value] * count)
                 self._data[key] = staged[key]
 
             self._save_unlocked()
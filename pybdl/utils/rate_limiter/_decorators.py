@@ -1,6 +1,7 @@
 """Decorators for rate-limiting functions."""
 
 import functools
+import threading
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
@@ -8,6 +9,25 @@ from pybdl.utils.rate_limiter._async import AsyncRateLimiter
 from pybdl.utils.rate_limiter._sync import RateLimiter
 
 T = TypeVar("T")
+_LimiterT = TypeVar("_LimiterT", RateLimiter, AsyncRateLimiter)
+
+# The API quota is global, so decorators declared with the same settings share one limiter.
+_registry_lock = threading.Lock()
+_limiters: dict[tuple[Any, ...], RateLimiter | AsyncRateLimiter] = {}
+
+
+def _shared_limiter(
+    limiter_cls: type[_LimiterT],
+    quotas: dict[int, int | tuple[int, int]],
+    is_registered: bool,
+    limiter_kwargs: dict[str, Any],
+) -> _LimiterT:
+    key = (limiter_cls, tuple(sorted(quotas.items())), is_registered, tuple(sorted(limiter_kwargs.items())))
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = limiter_cls(quotas, is_registered, **limiter_kwargs)
+        return limiter  # type: ignore[return-value]
 
 
 def rate_limit(
@@ -15,7 +35,7 @@ def rate_limit(
     is_registered: bool,
     **limiter_kwargs: Any,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    limiter = RateLimiter(quotas, is_registered, **limiter_kwargs)
+    limiter = _shared_limiter(RateLimiter, quotas, is_registered, limiter_kwargs)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
@@ -33,7 +53,7 @@ def async_rate_limit(
     is_registered: bool,
     **limiter_kwargs: Any,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
-    limiter = AsyncRateLimiter(quotas, is_registered, **limiter_kwargs)
+    limiter = _shared_limiter(AsyncRateLimiter, quotas, is_registered, limiter_kwargs)
 
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
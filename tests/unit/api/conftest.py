@@ -18,9 +18,14 @@ def disable_rate_limiting(request: pytest.FixtureRequest) -> Generator[Any, Any,
     async def _noop_async_acquire(self: Any) -> None:
         return None
 
+    async def _noop_async_acquire_many(self: Any, count: int) -> list[None]:
+        return [None] * count
+
     with (
         patch("pybdl.utils.rate_limiter._sync.RateLimiter.acquire", lambda self: None),
+        patch("pybdl.utils.rate_limiter._sync.RateLimiter.acquire_many", lambda self, count: [None] * count),
         patch("pybdl.utils.rate_limiter._async.AsyncRateLimiter.acquire", new=_noop_async_acquire),
+        patch("pybdl.utils.rate_limiter._async.AsyncRateLimiter.acquire_many", new=_noop_async_acquire_many),
     ):
         yield
 
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from concurrent.futures import Future
 from typing import Any
 
 import httpx
@@ -101,6 +104,104 @@ def test_make_request_with_headers(respx_mock: respx.MockRouter, base_client: Ba
     assert req_headers["X-ClientId"] == "dummy-api-key"
 
 
+@pytest.mark.unit
+def test_request_sync_coalesces_identical_inflight_requests(
+    respx_mock: respx.MockRouter, base_client: BaseAPIClient, api_url: str
+) -> None:
+    joined = threading.Event()
+
+    class _Inflight(dict[Any, Any]):
+        def get(self, key: Any, default: Any = None) -> Any:
+            pending = super().get(key, default)
+            if pending is not None:
+                joined.set()
+            return pending
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        assert joined.wait(5)
+        return httpx.Response(200, json={"results": [1]})
+
+    base_client._inflight_sync = _Inflight()
+    route = respx_mock.get(f"{api_url}/levels?lang=en").mock(side_effect=respond)
+    results: list[dict[str, Any]] = []
+    threads = [threading.Thread(target=lambda: results.append(base_client._request_sync("levels"))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert route.call_count == 1
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert base_client._inflight_sync == {}
+
+
+@pytest.mark.unit
+def test_merge_headers_reuses_session_snapshot(base_client: BaseAPIClient) -> None:
+    assert base_client._merge_headers() is base_client._merge_headers(None)
+    merged = base_client._merge_headers({"X-Test-Header": "foo"})
+    assert merged["X-Test-Header"] == "foo"
+    assert merged["x-clientid"] == "dummy-api-key"
+    assert "X-Test-Header" not in base_client._merge_headers()
+
+
+@pytest.mark.unit
+def test_client_uses_configured_connection_pool_limits() -> None:
+    client = BaseAPIClient(
+        BDLConfig(api_key="dummy-api-key", use_cache=False, max_connections=16, max_keepalive_connections=8)
+    )
+    pool = client.session._transport._pool  # type: ignore[attr-defined]
+
+    assert pool._max_connections == 16
+    assert pool._max_keepalive_connections == 8
+    client.close()
+
+
+@pytest.mark.unit
+def test_build_query_applies_defaults_without_mutating_params(base_client: BaseAPIClient) -> None:
+    params = {"unit-level": 2}
+
+    assert base_client._build_query(params, 50) == {"unit-level": 2, "lang": "en", "page-size": 50}
+    assert base_client._build_query({"lang": "pl"}) == {"lang": "pl"}
+    assert base_client._build_query(None) == {"lang": "en"}
+    assert params == {"unit-level": 2}
+
+
+@pytest.mark.unit
+def test_prepare_api_params_and_headers_returns_fresh_dicts(base_client: BaseAPIClient) -> None:
+    params, headers = base_client._prepare_api_params_and_headers(if_none_match='"v1"', extra_params={"year": [2021]})
+    params["page-size"] = 10
+
+    assert headers == {"Accept-Language": "en", "Accept": "application/json", "If-None-Match": '"v1"'}
+    assert base_client._prepare_api_params_and_headers() == (
+        {"lang": "en", "format": "json"},
+        {"Accept-Language": "en", "Accept": "application/json"},
+    )
+    assert base_client._prepare_api_params_and_headers(lang="pl", format="xml") == (
+        {"lang": "pl", "format": "xml"},
+        {"Accept-Language": "pl", "Accept": "application/xml"},
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("headers", "content", "expected"),
+    [
+        ({"Content-Type": "application/json; charset=utf-8"}, b'{"errors": ["bad"]}', {"errors": ["bad"]}),
+        ({"Content-Type": "application/problem+json"}, b'{"title": "bad"}', {"title": "bad"}),
+        ({"Content-Type": "text/html"}, b'{"looks": "like json"}', '{"looks": "like json"}'),
+        ({"Content-Type": "application/json"}, b"not json", "not json"),
+        ({}, b'{"errors": []}', {"errors": []}),
+    ],
+)
+def test_extract_error_detail_respects_content_type(
+    base_client: BaseAPIClient, headers: dict[str, str], content: bytes, expected: Any
+) -> None:
+    response = httpx.Response(500, headers=headers, content=content)
+
+    assert base_client._extract_error_detail(response) == expected
+
+
 @pytest.mark.unit
 def test_paginated_request_all_pages(respx_mock: respx.MockRouter, base_client: BaseAPIClient, api_url: str) -> None:
     endpoint = "data/paged"
@@ -307,6 +408,213 @@ def test_paginated_request_sync_missing_results_key(respx_mock: respx.MockRouter
         next(it)
 
 
+@pytest.mark.unit
+def test_paginated_request_sync_prefetches_next_page(monkeypatch: Any, base_client: BaseAPIClient) -> None:
+    requested = threading.Event()
+    first_page = {"results": [{"id": 1}], "links": {"next": "https://example.test/next"}}
+
+    def fake_request_url(url: str, **kwargs: Any) -> dict[str, Any]:
+        requested.set()
+        return {"results": [{"id": 2}], "links": {}}
+
+    monkeypatch.setattr(base_client, "_request_sync", lambda *a, **k: first_page)
+    monkeypatch.setattr(base_client, "_request_sync_url", fake_request_url)
+
+    it = base_client._paginated_request_sync("data/prefetch", results_key="results")
+    assert next(it) is first_page
+    # The second page is requested before the caller asks for it.
+    assert requested.wait(timeout=5)
+    assert next(it)["results"] == [{"id": 2}]
+    assert list(it) == []
+
+
+@pytest.mark.unit
+def test_paginated_request_sync_max_pages_skips_prefetch(monkeypatch: Any, base_client: BaseAPIClient) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(
+        base_client,
+        "_request_sync",
+        lambda *a, **k: {"results": [{"id": 1}], "links": {"next": "https://example.test/next"}},
+    )
+    monkeypatch.setattr(base_client, "_request_sync_url", lambda url, **k: calls.append(url))
+
+    pages = list(base_client._paginated_request_sync("data/prefetch", results_key="results", max_pages=1))
+    assert len(pages) == 1
+    assert calls == []
+
+
+@pytest.mark.unit
+async def test_paginated_request_async_prefetches_next_page(monkeypatch: Any, base_client: BaseAPIClient) -> None:
+    requested = asyncio.Event()
+    first_page = {"results": [{"id": 1}], "links": {"next": "https://example.test/next"}}
+
+    async def fake_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return first_page
+
+    async def fake_request_url(url: str, **kwargs: Any) -> dict[str, Any]:
+        requested.set()
+        return {"results": [{"id": 2}], "links": {}}
+
+    monkeypatch.setattr(base_client, "_request_async", fake_request)
+    monkeypatch.setattr(base_client, "_request_async_url", fake_request_url)
+
+    it = base_client._paginated_request_async("data/prefetch", results_key="results")
+    assert await anext(it) is first_page
+    # The second page is requested before the caller asks for it.
+    await asyncio.wait_for(requested.wait(), timeout=5)
+    assert (await anext(it))["results"] == [{"id": 2}]
+    assert [page async for page in it] == []
+
+
+@pytest.mark.unit
+async def test_paginated_request_async_early_exit_cancels_prefetch(
+    monkeypatch: Any, base_client: BaseAPIClient
+) -> None:
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fake_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return {"results": [{"id": 1}], "links": {"next": "https://example.test/next"}}
+
+    async def fake_request_url(url: str, **kwargs: Any) -> dict[str, Any]:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return {"results": [], "links": {}}
+
+    monkeypatch.setattr(base_client, "_request_async", fake_request)
+    monkeypatch.setattr(base_client, "_request_async_url", fake_request_url)
+
+    it = base_client._paginated_request_async("data/prefetch", results_key="results")
+    await anext(it)
+    await asyncio.wait_for(started.wait(), timeout=5)
+    await it.aclose()
+    assert cancelled.is_set()
+
+
+@pytest.mark.unit
+async def test_paginated_request_async_max_pages_skips_prefetch(monkeypatch: Any, base_client: BaseAPIClient) -> None:
+    calls: list[str] = []
+
+    async def fake_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return {"results": [{"id": 1}], "links": {"next": "https://example.test/next"}}
+
+    async def fake_request_url(url: str, **kwargs: Any) -> dict[str, Any]:
+        calls.append(url)
+        return {"results": [{"id": 2}], "links": {"next": "https://example.test/next2"}}
+
+    monkeypatch.setattr(base_client, "_request_async", fake_request)
+    monkeypatch.setattr(base_client, "_request_async_url", fake_request_url)
+
+    pages = [
+        page async for page in base_client._paginated_request_async("data/prefetch", results_key="results", max_pages=2)
+    ]
+    assert [page["results"] for page in pages] == [[{"id": 1}], [{"id": 2}]]
+    assert calls == ["https://example.test/next"]
+
+
+@pytest.mark.unit
+def test_fetch_all_results_fetches_known_pages_by_index(
+    respx_mock: respx.MockRouter, base_client: BaseAPIClient, api_url: str
+) -> None:
+    url = f"{api_url}/variables"
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    routes = [
+        respx_mock.get(f"{url}?lang=en&page-size=2" + (f"&page={index}" if index else "")).mock(
+            return_value=httpx.Response(
+                200, json={"results": results, "totalRecords": 5, "links": {"next": f"{url}?cursor={index}"}}
+            )
+        )
+        for index, results in enumerate(pages)
+    ]
+    batches: list[int] = []
+
+    def acquire_many(count: int) -> list[float | None]:
+        batches.append(count)
+        return [None] * count
+
+    base_client._sync_limiter.acquire_many = acquire_many  # type: ignore[method-assign]
+    results = base_client.fetch_all_results("variables", page_size=2, show_progress=False, max_workers=2)
+
+    assert results == [item for page in pages for item in page]
+    assert [route.call_count for route in routes] == [1, 1, 1]
+    assert batches == [2]
+
+
+@pytest.mark.unit
+def test_fetch_all_results_single_worker_follows_links(
+    respx_mock: respx.MockRouter, base_client: BaseAPIClient, api_url: str
+) -> None:
+    url = f"{api_url}/variables"
+    respx_mock.get(f"{url}?lang=en&page-size=1").mock(
+        return_value=httpx.Response(
+            200, json={"results": [{"id": 1}], "totalRecords": 2, "links": {"next": f"{url}?cursor=1"}}
+        )
+    )
+    respx_mock.get(f"{url}?cursor=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 2}], "totalRecords": 2, "links": {}})
+    )
+
+    results = base_client.fetch_all_results("variables", page_size=1, show_progress=False, max_workers=1)
+
+    assert results == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.unit
+def test_fetch_all_results_rejects_invalid_max_workers(base_client: BaseAPIClient) -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        base_client.fetch_all_results("variables", show_progress=False, max_workers=0)
+
+
+@pytest.mark.unit
+def test_fetch_all_results_resumes_from_checkpoint(respx_mock: respx.MockRouter, base_client: BaseAPIClient) -> None:
+    url = "https://bdl.stat.gov.pl/api/v1/data/resume"
+    first = respx_mock.get(f"{url}?lang=en&page-size=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 1}], "links": {"next": f"{url}?page=1"}})
+    )
+    respx_mock.get(f"{url}?page=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 2}], "links": {"next": f"{url}?page=2"}})
+    )
+    respx_mock.get(f"{url}?page=2").mock(return_value=httpx.Response(200, json={"results": [{"id": 3}], "links": {}}))
+    checkpoints: list[str | None] = []
+
+    results = base_client.fetch_all_results(
+        "data/resume",
+        page_size=1,
+        show_progress=False,
+        resume_from=f"{url}?page=1",
+        on_page=lambda page: checkpoints.append(page["links"].get("next")),
+    )
+
+    assert results == [{"id": 2}, {"id": 3}]
+    assert checkpoints == [f"{url}?page=2", None]
+    assert first.call_count == 0
+
+
+@pytest.mark.unit
+def test_fetch_all_results_stream_is_lazy(respx_mock: respx.MockRouter, base_client: BaseAPIClient) -> None:
+    url = "https://bdl.stat.gov.pl/api/v1/data/stream"
+    first = respx_mock.get(f"{url}?lang=en&page-size=2").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 1}, {"id": 2}], "links": {"next": f"{url}?page=1"}})
+    )
+    respx_mock.get(f"{url}?page=1").mock(return_value=httpx.Response(200, json={"results": [{"id": 3}], "links": {}}))
+
+    results = base_client.fetch_all_results("data/stream", page_size=2, show_progress=False, stream=True)
+
+    assert first.call_count == 0
+    assert next(results) == {"id": 1}
+    assert list(results) == [{"id": 2}, {"id": 3}]
+
+
+@pytest.mark.unit
+def test_fetch_all_results_stream_rejects_metadata(base_client: BaseAPIClient) -> None:
+    with pytest.raises(ValueError, match="stream=True"):
+        base_client.fetch_all_results("data/stream", return_metadata=True, stream=True)  # type: ignore[call-overload]
+
+
 @pytest.mark.unit
 def test_paginated_request_sync_progress_bar(
     monkeypatch: Any, respx_mock: respx.MockRouter, base_client: BaseAPIClient
@@ -319,7 +627,7 @@ def test_paginated_request_sync_progress_bar(
         def update(self, n: int) -> None:
             self.total = n
 
-        def set_postfix(self, d: Any) -> None:
+        def set_postfix(self, d: Any, refresh: bool = True) -> None:
             pass
 
         def close(self) -> None:
@@ -335,6 +643,32 @@ def test_paginated_request_sync_progress_bar(
     assert results == [{"id": 1}]
 
 
+@pytest.mark.unit
+def test_fetch_all_results_progress_redraws_are_throttled(monkeypatch: Any, base_client: BaseAPIClient) -> None:
+    import io
+
+    from tqdm import tqdm
+
+    refreshes: list[int] = []
+
+    class CountingBar(tqdm):  # type: ignore[misc]
+        def __init__(self, *a: Any, **k: Any) -> None:
+            super().__init__(*a, **{**k, "file": io.StringIO(), "mininterval": 60})
+
+        def refresh(self, *a: Any, **k: Any) -> None:
+            refreshes.append(self.n)
+            super().refresh(*a, **k)
+
+    pages = [{"results": [{"id": index}], "links": {}} for index in range(20)]
+    monkeypatch.setattr("pybdl.api.client.tqdm", CountingBar)
+    monkeypatch.setattr(base_client, "_paginated_request_sync", lambda *a, **k: iter(pages))
+
+    results = base_client.fetch_all_results("data/progress", show_progress=True)
+
+    assert len(results) == 20
+    assert len(refreshes) < 5
+
+
 @pytest.mark.unit
 def test_fetch_single_result_metadata_and_error(respx_mock: respx.MockRouter, base_client: BaseAPIClient) -> None:
     endpoint = "data/single"
@@ -558,3 +892,75 @@ def test_client_registered_has_api_key_header() -> None:
 
     # X-ClientId header should be present with the api_key
     assert client.session.headers["X-ClientId"] == api_key
+
+
+@pytest.mark.unit
+def test_map_calls_runs_on_threads_and_keeps_order(base_client: BaseAPIClient) -> None:
+    threads: set[str] = set()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def lookup(level: int, lang: str) -> str:
+        threads.add(threading.current_thread().name)
+        barrier.wait()
+        return f"{level}-{lang}"
+
+    results = base_client.map_calls(lookup, [(1, "pl"), (2, "en"), (3, "pl")], max_workers=3)
+
+    assert results == ["1-pl", "2-en", "3-pl"]
+    assert len(threads) == 3
+    with pytest.raises(ValueError, match="max_workers"):
+        base_client.map_calls(lookup, [(1, "pl")], max_workers=0)
+
+
+@pytest.mark.unit
+async def test_amap_calls_keeps_order_and_raises_first_error(base_client: BaseAPIClient) -> None:
+    async def lookup(level: int) -> int:
+        if level < 0:
+            raise KeyError(level)
+        return level * 10
+
+    assert await base_client.amap_calls(lookup, [(1,), (2,), (3,)], max_concurrent=2) == [10, 20, 30]
+    with pytest.raises(KeyError):
+        await base_client.amap_calls(lookup, [(1,), (-1,), (-2,)])
+
+
+@pytest.mark.unit
+@pytest.mark.real_rate_limiting
+def test_paginated_request_sync_early_exit_releases_unsent_reservations(
+    respx_mock: respx.MockRouter, monkeypatch: pytest.MonkeyPatch, api_url: str
+) -> None:
+    class DeferredExecutor:
+        """Run only the first submitted request; later ones stay queued as if every worker were busy."""
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.started = False
+
+        def submit(self, fn: Any, *args: Any, **kwargs: Any) -> Future[Any]:
+            future: Future[Any] = Future()
+            if not self.started:
+                self.started = True
+                future.set_result(fn(*args, **kwargs))
+            return future
+
+        def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+            pass
+
+    url = f"{api_url}/variables"
+    for index in range(5):
+        respx_mock.get(f"{url}?lang=en&page-size=1" + (f"&page={index}" if index else "")).mock(
+            return_value=httpx.Response(
+                200, json={"results": [{"id": index}], "totalRecords": 5, "links": {"next": f"{url}?cursor={index}"}}
+            )
+        )
+    monkeypatch.setattr("pybdl.api.client.ThreadPoolExecutor", DeferredExecutor)
+    client = BaseAPIClient(
+        BDLConfig(api_key="dummy-api-key", use_cache=False, custom_quotas={900: 100}, quota_cache_enabled=False)
+    )
+
+    pages = client._paginated_request_sync("variables", page_size=1, max_workers=4)
+    assert next(pages)["results"] == [{"id": 0}]
+    assert next(pages)["results"] == [{"id": 1}]
+    pages.close()
+
+    assert len(respx_mock.calls) == 2
+    assert len(client._sync_limiter.calls[900]) == 2
@@ -1,7 +1,12 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
 import pytest
+import respx
 
 from pybdl.api.client import BaseAPIClient
-from pybdl.api.exceptions import BDLResponseError
+from pybdl.api.exceptions import BDLHTTPError, BDLResponseError
 from pybdl.config import BDLConfig
 
 
@@ -32,10 +37,11 @@ async def test_async_fetch_all_results_return_metadata(
 async def test_async_fetch_all_results_missing_results_key_raises(
     async_client: BaseAPIClient, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    async def fake_paginated(*args: object, **kwargs: object) -> object:
-        yield {"notresults": []}
+    async def fake_request_async(*args: object, **kwargs: object) -> dict[str, object]:
+        return {"notresults": []}
 
-    monkeypatch.setattr(async_client, "_paginated_request_async", fake_paginated)
+    # The paginator validates every page, so the error surfaces through afetch_all_results.
+    monkeypatch.setattr(async_client, "_request_async", fake_request_async)
     with pytest.raises(BDLResponseError):
         await async_client.afetch_all_results("data/bad", results_key="results", page_size=2, show_progress=False)
 
@@ -98,10 +104,11 @@ async def test_afetch_all_results_metadata_and_error(
     assert results2 == [{"id": 1}]
 
     # Missing results_key
-    async def fake_bad(*args: object, **kwargs: object) -> object:
-        yield {"notresults": []}
+    async def fake_bad(*args: object, **kwargs: object) -> dict[str, object]:
+        return {"notresults": []}
 
-    monkeypatch.setattr(async_client, "_paginated_request_async", fake_bad)
+    monkeypatch.undo()
+    monkeypatch.setattr(async_client, "_request_async", fake_bad)
     with pytest.raises(BDLResponseError):
         await async_client.afetch_all_results("endpoint", results_key="results", show_progress=False)
 
@@ -116,7 +123,7 @@ async def test_afetch_all_results_progress_bar(monkeypatch: pytest.MonkeyPatch,
         def update(self, n: int) -> None:
             self.total = n
 
-        def set_postfix(self, d: dict) -> None:
+        def set_postfix(self, d: dict, refresh: bool = True) -> None:
             pass
 
         def close(self) -> None:
@@ -155,3 +162,233 @@ async def test_afetch_single_result_metadata_and_error(
     monkeypatch.setattr(async_client, "_request_async", fake_bad)
     with pytest.raises(BDLResponseError):
         await async_client.afetch_single_result("endpoint", results_key="results")
+
+
+@pytest.mark.asyncio
+async def test_request_async_coalesces_identical_inflight_requests(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    route = respx_mock.get(f"{api_url}/levels").mock(return_value=httpx.Response(200, json={"results": [1]}))
+
+    first, second = await asyncio.gather(client._request_async("levels"), client._request_async("levels"))
+
+    assert first == second == {"results": [1]}
+    assert route.call_count == 1
+    assert client._inflight == {}
+
+    await client._request_async("levels")
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_async_does_not_coalesce_different_params(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    route = respx_mock.get(f"{api_url}/levels").mock(return_value=httpx.Response(200, json={"results": []}))
+
+    await asyncio.gather(
+        client._request_async("levels", params={"page": 1}),
+        client._request_async("levels", params={"page": 2}),
+    )
+
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_created_lazily_and_reused(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    assert client._async_http_client is None
+
+    respx_mock.get(f"{api_url}/levels").mock(return_value=httpx.Response(200, json={"results": []}))
+    await client._request_async("levels")
+    pooled = client._async_http_client
+    assert pooled is not None
+    await client._request_async("levels", params={"page": 1})
+    assert client._async_client is pooled
+
+    await client.aclose()
+    assert client._async_http_client is None
+
+
+def _mock_indexed_pages(respx_mock: respx.MockRouter, url: str, pages: list[list[dict[str, int]]]) -> list:
+    routes = []
+    for index, results in enumerate(pages):
+        # Exact URLs, so the first page's route does not also answer the ``page=N`` requests.
+        page_url = f"{url}?lang=en&page-size=2" + (f"&page={index}" if index else "")
+        payload: dict[str, object] = {"results": results, "totalRecords": 5, "links": {}}
+        if index + 1 < len(pages):
+            payload["links"] = {"next": f"{url}?lang=en&page-size=2&page={index + 1}"}
+        routes.append(respx_mock.get(page_url).mock(return_value=httpx.Response(200, json=payload)))
+    return routes
+
+
+@pytest.mark.asyncio
+async def test_paginated_request_async_fetches_known_pages_concurrently(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    routes = _mock_indexed_pages(respx_mock, f"{api_url}/variables", pages)
+
+    results = await client.afetch_all_results("variables", page_size=2, show_progress=False)
+
+    assert results == [item for page in pages for item in page]
+    assert all(route.call_count == 1 for route in routes)
+
+
+@pytest.mark.asyncio
+async def test_paginated_request_async_respects_max_pages_when_concurrent(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    routes = _mock_indexed_pages(respx_mock, f"{api_url}/variables", pages)
+
+    results = await client.afetch_all_results("variables", page_size=2, max_pages=2, show_progress=False)
+
+    assert results == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert routes[2].call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_paginated_request_async_reserves_quota_per_batch(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    _mock_indexed_pages(respx_mock, f"{api_url}/variables", pages)
+    batches: list[int] = []
+
+    async def acquire_many(count: int) -> list[None]:
+        batches.append(count)
+        return [None] * count
+
+    with patch.object(client._async_limiter, "acquire_many", side_effect=acquire_many):
+        results = await client.afetch_all_results("variables", page_size=2, show_progress=False)
+
+    assert results == [item for page in pages for item in page]
+    assert batches == [2]
+
+
+@pytest.mark.asyncio
+async def test_afetch_all_results_resumes_from_checkpoint(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    routes = _mock_indexed_pages(respx_mock, f"{api_url}/variables", pages)
+    seen: list[dict[str, object]] = []
+
+    results = await client.afetch_all_results(
+        "variables",
+        page_size=2,
+        show_progress=False,
+        resume_from=f"{api_url}/variables?lang=en&page-size=2&page=1",
+        on_page=seen.append,
+    )
+
+    assert results == [{"id": 3}, {"id": 4}, {"id": 5}]
+    assert len(seen) == 2
+    assert [route.call_count for route in routes] == [0, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_afetch_all_results_stream_yields_items(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    _mock_indexed_pages(respx_mock, f"{api_url}/variables", pages)
+
+    results = await client.afetch_all_results("variables", page_size=2, show_progress=False, stream=True)
+
+    assert [item async for item in results] == [item for page in pages for item in page]
+
+
+@pytest.mark.asyncio
+async def test_paginated_request_async_sequential_when_concurrency_is_one(
+    respx_mock: respx.MockRouter, api_url: str
+) -> None:
+    client = BaseAPIClient(BDLConfig(api_key="dummy-api-key", use_cache=False, page_concurrency=1))
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    routes = _mock_indexed_pages(respx_mock, f"{api_url}/variables", pages)
+
+    results = await client.afetch_all_results("variables", page_size=2, show_progress=False)
+
+    assert results == [item for page in pages for item in page]
+    assert all(route.call_count == 1 for route in routes)
+
+
+@pytest.mark.asyncio
+async def test_afetch_all_results_max_concurrent_overrides_config(
+    respx_mock: respx.MockRouter, dummy_config: BDLConfig, api_url: str
+) -> None:
+    client = BaseAPIClient(dummy_config)
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+    _mock_indexed_pages(respx_mock, f"{api_url}/variables", pages)
+    batches: list[int] = []
+
+    async def acquire_many(count: int) -> list[None]:
+        batches.append(count)
+        return [None] * count
+
+    with patch.object(client._async_limiter, "acquire_many", side_effect=acquire_many):
+        results = await client.afetch_all_results("variables", page_size=2, show_progress=False, max_concurrent=1)
+
+    assert results == [item for page in pages for item in page]
+    assert batches == []
+
+    with pytest.raises(ValueError, match="max_concurrent"):
+        await client.afetch_all_results("variables", page_size=2, show_progress=False, max_concurrent=0)
+
+
+@pytest.mark.asyncio
+async def test_paginated_request_async_concurrent_page_error_is_raised(
+    respx_mock: respx.MockRouter, api_url: str
+) -> None:
+    client = BaseAPIClient(BDLConfig(api_key="dummy-api-key", use_cache=False, request_retries=0))
+    url = f"{api_url}/variables"
+    respx_mock.get(f"{url}?lang=en&page-size=2").mock(
+        return_value=httpx.Response(
+            200,
+            json={"results": [{"id": 1}, {"id": 2}], "totalRecords": 6, "links": {"next": f"{url}?page=1"}},
+        )
+    )
+    respx_mock.get(f"{url}?lang=en&page-size=2&page=1").mock(return_value=httpx.Response(404, json={}))
+    respx_mock.get(f"{url}?lang=en&page-size=2&page=2").mock(return_value=httpx.Response(404, json={}))
+
+    with pytest.raises(BDLHTTPError):
+        await client.afetch_all_results("variables", page_size=2, show_progress=False)
+
+
+@pytest.mark.asyncio
+@pytest.mark.real_rate_limiting
+async def test_paginated_request_async_early_exit_releases_unsent_reservations(
+    respx_mock: respx.MockRouter, api_url: str
+) -> None:
+    url = f"{api_url}/variables"
+    for index in range(5):
+        respx_mock.get(f"{url}?lang=en&page-size=1" + (f"&page={index}" if index else "")).mock(
+            return_value=httpx.Response(
+                200, json={"results": [{"id": index}], "totalRecords": 5, "links": {"next": f"{url}?cursor={index}"}}
+            )
+        )
+    client = BaseAPIClient(
+        BDLConfig(api_key="dummy-api-key", use_cache=False, custom_quotas={900: 100}, quota_cache_enabled=False)
+    )
+
+    pages = client._paginated_request_async("variables", page_size=1, max_concurrent=2)
+    assert (await anext(pages))["results"] == [{"id": 0}]
+    # Awaiting page 1 starts pages 1 and 2; handing it out refills the window with page 3,
+    # which has not started when the caller stops.
+    assert (await anext(pages))["results"] == [{"id": 1}]
+    await pages.aclose()
+    await asyncio.gather(*client._inflight.values())
+
+    assert len(respx_mock.calls) == 3
+    assert len(client._async_limiter.calls[900]) == 3
+    await client.aclose()
@@ -1,8 +1,10 @@
+import asyncio
 from pathlib import Path
 
 import httpx
 import pytest
 import respx
+from hishel import SyncSqliteStorage
 from hishel.httpx import AsyncCacheClient, SyncCacheClient
 
 from pybdl.api.client import BaseAPIClient
@@ -146,6 +148,40 @@ async def test_quota_not_consumed_on_cache_hit_async(monkeypatch: pytest.MonkeyP
         await client.aclose()
 
 
+@pytest.mark.unit
+@pytest.mark.real_rate_limiting
+@respx.mock
+def test_quota_refunded_when_connection_fails() -> None:
+    url = "https://bdl.stat.gov.pl/api/v1/data/connect-refund?lang=en"
+    respx.get(url).mock(side_effect=[httpx.ConnectError("refused"), httpx.Response(200, json={"results": [{"id": 1}]})])
+    client = BaseAPIClient(_build_config(cache_backend=None))
+    client.config.retry_backoff_factor = 0
+    try:
+        client._request_sync("data/connect-refund")
+        # Only the request that reached the API keeps its quota slot.
+        assert client._sync_limiter.get_remaining_quota()[1] == 1
+    finally:
+        client.close()
+
+
+@pytest.mark.unit
+@pytest.mark.real_rate_limiting
+@pytest.mark.asyncio
+@respx.mock
+async def test_quota_refunded_when_connection_fails_async() -> None:
+    url = "https://bdl.stat.gov.pl/api/v1/data/connect-refund-async?lang=en"
+    respx.get(url).mock(
+        side_effect=[httpx.ConnectTimeout("timed out"), httpx.Response(200, json={"results": [{"id": 1}]})]
+    )
+    client = BaseAPIClient(_build_config(cache_backend=None))
+    client.config.retry_backoff_factor = 0
+    try:
+        await client._request_async("data/connect-refund-async")
+        assert (await client._async_limiter.get_remaining_quota_async())[1] == 1
+    finally:
+        await client.aclose()
+
+
 @pytest.mark.unit
 def test_persistent_quota_cache_corrupt_json_starts_empty(tmp_path: Path) -> None:
     """Corrupt cache file is ignored; in-memory state is empty."""
@@ -184,3 +220,139 @@ def test_remove_last_if_matches_disabled_returns_false(tmp_path: Path) -> None:
     cache = PersistentQuotaCache(enabled=False, cache_file=cache_file)
     cache._data = {"k": [1.0]}
     assert cache.remove_last_if_matches("k", 1.0) is False
+
+
+@pytest.mark.unit
+@respx.mock
+def test_cache_hits_reuse_decoded_payload(tmp_path: Path) -> None:
+    respx.get("https://bdl.stat.gov.pl/api/v1/data/cache-decoded?lang=en").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 1}]})
+    )
+    client = BaseAPIClient(_build_config(cache_backend="memory", quota_cache_file=tmp_path / "quota_cache.json"))
+    try:
+        client._request_sync("data/cache-decoded")
+        second = client._request_sync("data/cache-decoded")
+        third = client._request_sync("data/cache-decoded")
+
+        assert second == {"results": [{"id": 1}]}
+        assert third is second
+    finally:
+        client.close()
+
+
+@pytest.mark.unit
+def test_cache_expire_after_is_applied_to_http_cache_storage(tmp_path: Path) -> None:
+    client = BaseAPIClient(_build_config(cache_backend="memory", quota_cache_file=tmp_path / "quota_cache.json"))
+    try:
+        assert isinstance(client.session, SyncCacheClient)
+        assert isinstance(client.session.storage, SyncSqliteStorage)
+        assert client.session.storage.default_ttl == 600
+    finally:
+        client.close()
+
+
+@pytest.mark.unit
+@respx.mock
+def test_not_modified_response_reuses_stored_payload() -> None:
+    url = "https://bdl.stat.gov.pl/api/v1/data/etag?lang=en"
+    seen: list[str | None] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"results": [{"id": 1}]}, headers={"ETag": '"v1"'})
+
+    respx.get(url).mock(side_effect=respond)
+    client = BaseAPIClient(_build_config(cache_backend=None))
+    try:
+        first = client.fetch_single_result("data/etag")
+        second = client.fetch_single_result("data/etag")
+    finally:
+        client.close()
+
+    assert seen == [None, '"v1"']
+    assert second is first
+
+
+@pytest.mark.unit
+def test_conditional_requests_disabled_by_zero_cache_size() -> None:
+    config = BDLConfig(api_key="dummy-api-key", cache_backend=None, conditional_cache_size=0)
+    with BaseAPIClient(config) as client:
+        assert client._conditional_cache is None
+
+
+@pytest.mark.unit
+def test_conditional_requests_disabled_with_http_cache(tmp_path: Path) -> None:
+    client = BaseAPIClient(_build_config(cache_backend="memory", quota_cache_file=tmp_path / "quota_cache.json"))
+    try:
+        assert client._conditional_cache is None
+    finally:
+        client.close()
+
+
+@pytest.mark.unit
+@respx.mock
+def test_clients_with_same_settings_share_session_and_memory_cache(tmp_path: Path) -> None:
+    route = respx.get("https://bdl.stat.gov.pl/api/v1/data/cache-shared?lang=en").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 1}]}, headers={"Cache-Control": "max-age=600"})
+    )
+    config = _build_config(cache_backend="memory", quota_cache_file=tmp_path / "quota_cache.json")
+    first = BaseAPIClient(config)
+    second = BaseAPIClient(config)
+    try:
+        assert first.session is second.session
+        first._request_sync("data/cache-shared")
+        second._request_sync("data/cache-shared")
+        assert route.call_count == 1
+
+        first.close()
+        first.close()
+        assert not second.session.is_closed
+    finally:
+        second.close()
+    assert second.session.is_closed
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@respx.mock
+async def test_clients_on_same_loop_share_async_client_and_memory_cache(tmp_path: Path) -> None:
+    route = respx.get("https://bdl.stat.gov.pl/api/v1/data/cache-shared-async?lang=en").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": 1}]}, headers={"Cache-Control": "max-age=600"})
+    )
+    config = _build_config(cache_backend="memory", quota_cache_file=tmp_path / "quota_cache.json")
+    first = BaseAPIClient(config)
+    second = BaseAPIClient(config)
+    try:
+        assert first._async_client is second._async_client
+        await first._request_async("data/cache-shared-async")
+        await second._request_async("data/cache-shared-async")
+        assert route.call_count == 1
+
+        shared = second._async_client
+        await first.aclose()
+        assert not shared.is_closed
+    finally:
+        await second.aclose()
+    assert shared.is_closed
+
+
+@pytest.mark.unit
+@respx.mock
+def test_async_client_is_replaced_on_a_new_event_loop() -> None:
+    respx.get("https://bdl.stat.gov.pl/api/v1/data/loops?lang=en").mock(
+        return_value=httpx.Response(200, json={"results": []})
+    )
+    client = BaseAPIClient(_build_config(cache_backend=None))
+
+    async def request() -> httpx.AsyncClient:
+        await client._request_async("data/loops")
+        return client._async_client
+
+    try:
+        first = asyncio.run(request())
+        second = asyncio.run(request())
+        assert first is not second
+    finally:
+        asyncio.run(client.aclose())
@@ -33,6 +33,71 @@ def test_get_data_by_unit(respx_mock: respx.MockRouter, data_api: DataAPI, api_u
     assert request_url is not None and "var-id=3643" in str(request_url)
 
 
+@pytest.mark.unit
+def test_iter_data_by_variable_fetches_pages_lazily(
+    respx_mock: respx.MockRouter, data_api: DataAPI, api_url: str
+) -> None:
+    url = f"{api_url}/data/by-variable/3643"
+    respx_mock.get(f"{url}?lang=en&format=json&year=2021&page-size=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "A"}], "links": {"next": f"{url}?page=1"}})
+    )
+    second = respx_mock.get(f"{url}?page=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "B"}], "links": {}})
+    )
+
+    rows = data_api.iter_data_by_variable("3643", years=[2021], page_size=1, max_workers=1)
+    assert len(respx_mock.calls) == 0
+    assert next(rows) == {"id": "A"}
+    assert list(rows) == [{"id": "B"}]
+    assert second.call_count == 1
+
+
+@pytest.mark.unit
+def test_get_data_by_unit_batch_splits_variables(respx_mock: respx.MockRouter, data_api: DataAPI, api_url: str) -> None:
+    url = f"{api_url}/data/by-unit/999"
+    respx_mock.get(f"{url}?var-id=1&var-id=2&lang=en&format=json&page-size=100").mock(
+        return_value=httpx.Response(200, json={"unitId": "999", "totalRecords": 2, "results": [{"id": 1}, {"id": 2}]})
+    )
+    respx_mock.get(f"{url}?var-id=3&lang=en&format=json&page-size=100").mock(
+        return_value=httpx.Response(200, json={"unitId": "999", "totalRecords": 1, "results": [{"id": 3}]})
+    )
+
+    results, metadata = data_api.get_data_by_unit_batch("999", [1, "2", 3], chunk_size=2, return_metadata=True)
+
+    assert results == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert metadata == {"unitId": "999", "totalRecords": 3}
+    assert len(respx_mock.calls) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [0, 51])
+def test_get_data_by_unit_batch_rejects_invalid_chunk_size(data_api: DataAPI, chunk_size: int) -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        data_api.get_data_by_unit_batch("999", [1], chunk_size=chunk_size)
+
+
+@pytest.mark.unit
+def test_get_data_by_units_keys_results_by_unit(respx_mock: respx.MockRouter, data_api: DataAPI, api_url: str) -> None:
+    for unit_id in ("1", "2"):
+        respx_mock.get(f"{api_url}/data/by-unit/{unit_id}?var-id=7&lang=en&format=json&page-size=100").mock(
+            return_value=httpx.Response(200, json={"results": [{"id": unit_id}]})
+        )
+
+    result = data_api.get_data_by_units(["1", "2", "1"], variable_ids=[7], max_workers=2)
+
+    assert result == {"1": [{"id": "1"}], "2": [{"id": "2"}]}
+    assert len(respx_mock.calls) == 2
+
+
+@pytest.mark.unit
+def test_get_data_by_variables_locality_keys_results_by_variable(data_api: DataAPI) -> None:
+    with patch.object(DataAPI, "get_data_by_variable_locality", side_effect=lambda v, p, **k: [{"var": v}]) as fetch:
+        result = data_api.get_data_by_variables_locality(["10", "20"], "parent", max_workers=1)
+
+    assert result == {"10": [{"var": "10"}], "20": [{"var": "20"}]}
+    assert fetch.call_count == 2
+
+
 @pytest.mark.unit
 def test_get_data_by_variable_locality(respx_mock: respx.MockRouter, data_api: DataAPI, api_url: str) -> None:
     url = f"{api_url}/data/localities/by-variable/7?lang=en&format=json&unit-parent-id=2&page-size=100"
@@ -62,6 +127,38 @@ def test_get_data_metadata(respx_mock: respx.MockRouter, data_api: DataAPI, api_
     assert result["info"] == "data metadata"
 
 
+@pytest.mark.unit
+def test_get_data_metadata_reused_within_ttl(
+    respx_mock: respx.MockRouter, data_api: DataAPI, api_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    route = respx_mock.get(f"{api_url}/data/metadata?lang=en&format=json").mock(
+        return_value=httpx.Response(200, json={"info": "data metadata"})
+    )
+    now = [1000.0]
+    monkeypatch.setattr("pybdl.api.client.time.monotonic", lambda: now[0])
+
+    first = data_api.get_data_metadata()
+    first["info"] = "mutated"
+    assert data_api.get_data_metadata() == {"info": "data metadata"}
+    assert route.call_count == 1
+
+    now[0] += data_api.config.metadata_cache_ttl
+    data_api.get_data_metadata()
+    assert route.call_count == 2
+
+
+@pytest.mark.unit
+def test_get_data_metadata_cache_bypassed_for_conditional_requests(
+    respx_mock: respx.MockRouter, data_api: DataAPI, api_url: str
+) -> None:
+    route = respx_mock.get(f"{api_url}/data/metadata?lang=en&format=json").mock(
+        return_value=httpx.Response(200, json={"info": "data metadata"})
+    )
+    data_api.get_data_metadata()
+    data_api.get_data_metadata(if_none_match='"abc"')
+    assert route.call_count == 2
+
+
 @pytest.mark.unit
 def test_get_data_metadata_error(data_api: DataAPI) -> None:
     # Simulate error in fetch_single_result
@@ -435,6 +532,38 @@ def test_get_data_by_variable_pagination(data_api: DataAPI) -> None:
     assert result[1] == 3  # max_pages
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("get_data_by_variable", {"variable_id": "v"}),
+        ("get_data_by_variable_locality", {"variable_id": "v", "unit_parent_id": "p"}),
+        ("get_data_by_unit_locality", {"unit_id": "u", "variable_ids": [1]}),
+    ],
+)
+def test_get_data_paginated_methods_pass_max_workers(data_api: DataAPI, method: str, kwargs: dict[str, Any]) -> None:
+    with patch.object(DataAPI, "fetch_all_results", return_value=[]) as fetch_all_results:
+        getattr(data_api, method)(**kwargs, max_workers=3)
+    assert fetch_all_results.call_args.kwargs["max_workers"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("aget_data_by_variable", {"variable_id": "v"}),
+        ("aget_data_by_variable_locality", {"variable_id": "v", "unit_parent_id": "p"}),
+        ("aget_data_by_unit_locality", {"unit_id": "u", "variable_ids": [1]}),
+    ],
+)
+async def test_aget_data_paginated_methods_pass_max_concurrent(
+    data_api: DataAPI, method: str, kwargs: dict[str, Any]
+) -> None:
+    with patch.object(DataAPI, "afetch_all_results", new_callable=AsyncMock, return_value=[]) as afetch_all_results:
+        await getattr(data_api, method)(**kwargs, max_concurrent=3)
+    assert afetch_all_results.call_args.kwargs["max_concurrent"] == 3
+
+
 @pytest.mark.asyncio
 @patch.object(DataAPI, "afetch_all_results", new_callable=AsyncMock)
 async def test_async_get_data_by_variable_pagination(afetch_all_results: AsyncMock, data_api: DataAPI) -> None:
@@ -464,6 +593,13 @@ def test_normalize_variable_ids_sequence() -> None:
     assert DataAPI._normalize_variable_ids([1, "2"]) == [1, 2]
 
 
+@pytest.mark.unit
+def test_data_by_variable_params_drops_unset_values() -> None:
+    params = DataAPI._data_by_variable_params([], "", None, 0, None, {"page": 3})
+    assert params == {"aggregate-id": 0, "page": 3}
+    assert DataAPI._assemble_params({"year": (), "unit-level": 0}, None) == {"unit-level": 0}
+
+
 @pytest.mark.unit
 def test_get_data_by_variable_with_metadata_sets_flag(data_api: DataAPI) -> None:
     captured: dict[str, Any] = {}
@@ -1,4 +1,5 @@
 # type: ignore
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -6,6 +7,10 @@ import pytest
 from pybdl.api.data import DataAPI
 
 
+class DummyError(Exception):
+    pass
+
+
 @pytest.mark.asyncio
 @patch.object(DataAPI, "afetch_all_results", new_callable=AsyncMock)
 @patch.object(DataAPI, "afetch_single_result", new_callable=AsyncMock)
@@ -203,3 +208,112 @@ async def test_async_get_data_by_unit_locality_edge_cases(
     afetch_all_results.return_value = ([{"id": 1}], None)
     result = await data_api_async.aget_data_by_unit_locality(unit_id="u", variable_ids=[1], return_metadata=True)
     assert result == ([{"id": 1}], None)
+
+
+@pytest.mark.asyncio
+@patch.object(DataAPI, "afetch_single_result", new_callable=AsyncMock)
+async def test_async_get_data_by_unit_batch_splits_variables(
+    afetch_single_result: AsyncMock, data_api_async: DataAPI
+) -> None:
+    async def fetch(endpoint, *, params, **kwargs):
+        return [{"id": var_id} for var_id in params["var-id"]], {"totalRecords": len(params["var-id"])}
+
+    afetch_single_result.side_effect = fetch
+    result = await data_api_async.aget_data_by_unit_batch("u", [1, 2, 3], chunk_size=2, return_metadata=True)
+
+    assert result == ([{"id": 1}, {"id": 2}, {"id": 3}], {"totalRecords": 3})
+    assert [call.kwargs["params"]["var-id"] for call in afetch_single_result.call_args_list] == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+@patch.object(DataAPI, "afetch_single_result", new_callable=AsyncMock)
+async def test_async_get_data_by_units_bounds_concurrency(
+    afetch_single_result: AsyncMock, data_api_async: DataAPI
+) -> None:
+    in_flight = peak = 0
+
+    async def fetch(endpoint, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return [{"endpoint": endpoint}]
+
+    afetch_single_result.side_effect = fetch
+    result = await data_api_async.aget_data_by_units(["1", "2", "3"], variable_ids=[7], max_concurrent=2)
+
+    assert result == {unit: [{"endpoint": f"data/by-unit/{unit}"}] for unit in ("1", "2", "3")}
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_data_by_variables_locality_raises_first_error(data_api_async: DataAPI) -> None:
+    async def fetch(variable_id, unit_parent_id, **kwargs):
+        if variable_id == "bad":
+            raise ValueError("boom")
+        return [{"var": variable_id}]
+
+    with (
+        patch.object(DataAPI, "aget_data_by_variable_locality", side_effect=fetch),
+        pytest.raises(ValueError, match="boom"),
+    ):
+        await data_api_async.aget_data_by_variables_locality(["ok", "bad"], "parent")
+
+
+@pytest.mark.asyncio
+@patch.object(DataAPI, "afetch_single_result", new_callable=AsyncMock)
+async def test_async_get_data_by_unit_batches_concurrent_calls(
+    afetch_single_result: AsyncMock, data_api_async: DataAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_api_async.config, "unit_batch_window", 0.001)
+    afetch_single_result.side_effect = lambda endpoint, *, params, **kwargs: [
+        {"id": var_id, "values": []} for var_id in params["var-id"]
+    ]
+
+    first, second, solo = await asyncio.gather(
+        data_api_async.aget_data_by_unit("u", variable_ids=[1, 2], years=[2021]),
+        data_api_async.aget_data_by_unit("u", variable_ids=[2, 3], years=[2021]),
+        data_api_async.aget_data_by_unit("u", variable_ids=[4], years=[2021], return_metadata=True),
+    )
+
+    assert first == [{"id": 1, "values": []}, {"id": 2, "values": []}]
+    assert second == [{"id": 2, "values": []}, {"id": 3, "values": []}]
+    assert solo == [{"id": 4, "values": []}]
+    assert sorted(call.kwargs["params"]["var-id"] for call in afetch_single_result.call_args_list) == [[1, 2, 3], [4]]
+
+
+@pytest.mark.asyncio
+@patch.object(DataAPI, "afetch_single_result", new_callable=AsyncMock)
+async def test_async_get_data_by_unit_batch_error_reaches_every_caller(
+    afetch_single_result: AsyncMock, data_api_async: DataAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_api_async.config, "unit_batch_window", 0.001)
+    afetch_single_result.side_effect = DummyError("down")
+
+    outcomes = await asyncio.gather(
+        data_api_async.aget_data_by_unit("u", variable_ids=[1]),
+        data_api_async.aget_data_by_unit("u", variable_ids=[2]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(outcome, DummyError) for outcome in outcomes)
+    assert afetch_single_result.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_iter_data_by_variable_yields_rows(data_api_async: DataAPI) -> None:
+    pages = [{"results": [{"id": 1}, {"id": 2}]}, {"results": [{"id": 3}]}]
+
+    async def paginate(*args, **kwargs):
+        for page in pages:
+            yield page
+
+    with patch.object(DataAPI, "_paginated_request_async", side_effect=paginate) as paginated:
+        rows = data_api_async.aiter_data_by_variable("v", years=[2021], max_concurrent=2)
+        assert paginated.call_count == 0
+        assert [row async for row in rows] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    assert paginated.call_args.args == ("data/by-variable/v",)
+    assert paginated.call_args.kwargs["params"]["year"] == [2021]
+    assert paginated.call_args.kwargs["max_concurrent"] == 2
@@ -66,6 +66,36 @@ def test_get_levels_metadata(respx_mock: respx.MockRouter, levels_api: LevelsAPI
     assert result["version"] == "1.0"
 
 
+@pytest.mark.unit
+def test_get_levels_metadata_cached_until_cleared(
+    respx_mock: respx.MockRouter, levels_api: LevelsAPI, api_url: str
+) -> None:
+    route = respx_mock.get(f"{api_url}/levels/metadata?lang=en&format=json").mock(
+        return_value=httpx.Response(200, json={"version": "1.0"})
+    )
+
+    levels_api.get_levels_metadata()
+    levels_api.get_levels_metadata()
+    assert route.call_count == 1
+
+    levels_api.clear_metadata_cache()
+    levels_api.get_levels_metadata()
+    assert route.call_count == 2
+
+
+@pytest.mark.unit
+async def test_aget_levels_metadata_shares_cache_with_sync(
+    respx_mock: respx.MockRouter, levels_api: LevelsAPI, api_url: str
+) -> None:
+    route = respx_mock.get(f"{api_url}/levels/metadata?lang=en&format=json").mock(
+        return_value=httpx.Response(200, json={"version": "1.0"})
+    )
+
+    levels_api.get_levels_metadata()
+    assert await levels_api.aget_levels_metadata() == {"version": "1.0"}
+    assert route.call_count == 1
+
+
 @pytest.mark.unit
 def test_list_levels_extra_query(respx_mock: respx.MockRouter, levels_api: LevelsAPI, api_url: str) -> None:
     url = f"{api_url}/levels?foo=bar&lang=en&format=json&page-size=100"
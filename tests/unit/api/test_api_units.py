@@ -162,3 +162,54 @@ def test_search_localities_params_optional_fields() -> None:
     assert p["page"] == 1
     assert p["sort"] == "id"
     assert p["z"] == "q"
+
+
+@pytest.mark.unit
+def test_iter_units_stops_fetching_when_caller_stops(
+    respx_mock: respx.MockRouter, units_api: UnitsAPI, api_url: str
+) -> None:
+    url = f"{api_url}/units"
+    respx_mock.get(f"{url}?level=2&lang=en&format=json&page-size=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "A"}], "links": {"next": f"{url}?page=1"}})
+    )
+    respx_mock.get(f"{url}?page=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "B"}], "links": {"next": f"{url}?page=2"}})
+    )
+    third = respx_mock.get(f"{url}?page=2").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "C"}], "links": {}})
+    )
+
+    rows = units_api.iter_units(level=[2], page_size=1, max_workers=1)
+    assert len(respx_mock.calls) == 0
+    assert next(rows) == {"id": "A"}
+    rows.close()
+    assert third.call_count == 0
+
+
+@pytest.mark.unit
+def test_get_units_fetches_each_unit_once(respx_mock: respx.MockRouter, units_api: UnitsAPI, api_url: str) -> None:
+    for unit_id in ("PL", "WAW"):
+        respx_mock.get(f"{api_url}/units/{unit_id}?lang=en&format=json").mock(
+            return_value=httpx.Response(200, json={"id": unit_id})
+        )
+
+    result = units_api.get_units(["WAW", "PL", "WAW"], max_workers=2)
+
+    assert list(result) == ["WAW", "PL"]
+    assert result["PL"] == {"id": "PL"}
+    assert len(respx_mock.calls) == 2
+
+
+@pytest.mark.unit
+def test_list_units_and_localities(respx_mock: respx.MockRouter, units_api: UnitsAPI, api_url: str) -> None:
+    respx_mock.get(f"{api_url}/units?parent-id=P1&lang=en&format=json&page-size=100").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "U1"}]})
+    )
+    respx_mock.get(f"{api_url}/units/localities?parent-id=P1&lang=en&format=json&page-size=100").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "L1"}]})
+    )
+
+    units, localities = units_api.list_units_and_localities("P1", max_pages=1)
+
+    assert units == [{"id": "U1"}]
+    assert localities == [{"id": "L1"}]
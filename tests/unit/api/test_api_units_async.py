@@ -77,3 +77,41 @@ async def test_aget_units_metadata(monkeypatch: pytest.MonkeyPatch, async_units_
     monkeypatch.setattr(async_units_api, "_request_async", fake)
     result = await async_units_api.aget_units_metadata()
     assert result["info"] == "Units API"
+
+
+@pytest.mark.asyncio
+async def test_aiter_search_localities(monkeypatch: pytest.MonkeyPatch, async_units_api: UnitsAPI) -> None:
+    seen: dict[str, object] = {}
+
+    async def fake(endpoint: str, **kwargs: object) -> object:
+        seen["endpoint"] = endpoint
+        seen["params"] = kwargs["params"]
+        yield {"results": [{"id": "L1"}]}
+        yield {"results": [{"id": "L2"}]}
+
+    monkeypatch.setattr(async_units_api, "_paginated_request_async", fake)
+    rows = [row async for row in async_units_api.aiter_search_localities(name="Loc", years=[2021])]
+    assert rows == [{"id": "L1"}, {"id": "L2"}]
+    assert seen["endpoint"] == "units/localities/search"
+    assert seen["params"] == {"lang": "en", "format": "json", "name": "Loc", "year": [2021]}
+
+
+@pytest.mark.asyncio
+async def test_aget_units(monkeypatch: pytest.MonkeyPatch, async_units_api: UnitsAPI) -> None:
+    async def fake(endpoint: str, **kwargs: object) -> dict[str, str]:
+        return {"id": endpoint.rsplit("/", 1)[-1]}
+
+    monkeypatch.setattr(async_units_api, "_request_async", fake)
+    result = await async_units_api.aget_units(["PL", "WAW", "PL"], max_concurrent=2)
+    assert result == {"PL": {"id": "PL"}, "WAW": {"id": "WAW"}}
+
+
+@pytest.mark.asyncio
+async def test_alist_units_and_localities(monkeypatch: pytest.MonkeyPatch, async_units_api: UnitsAPI) -> None:
+    async def fake(endpoint: str, **kwargs: object) -> object:
+        yield {"results": [{"endpoint": endpoint}]}
+
+    monkeypatch.setattr(async_units_api, "_paginated_request_async", fake)
+    units, localities = await async_units_api.alist_units_and_localities("P1")
+    assert units == [{"endpoint": "units"}]
+    assert localities == [{"endpoint": "units/localities"}]
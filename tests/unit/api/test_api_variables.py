@@ -180,3 +180,18 @@ def test_list_params_level_years_and_page() -> None:
     assert p["page"] == 2
     assert p["sort"] == "name"
     assert p["f"] == "g"
+
+
+@pytest.mark.unit
+def test_iter_search_variables_streams_pages(
+    respx_mock: respx.MockRouter, variables_api: VariablesAPI, api_url: str
+) -> None:
+    url = f"{api_url}/variables/search"
+    respx_mock.get(f"{url}?name=pop&lang=en&format=json&page-size=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "1"}], "links": {"next": f"{url}?page=1"}})
+    )
+    respx_mock.get(f"{url}?page=1").mock(return_value=httpx.Response(200, json={"results": [{"id": "2"}], "links": {}}))
+
+    rows = variables_api.iter_search_variables(name="pop", page_size=1, max_workers=1)
+    assert len(respx_mock.calls) == 0
+    assert list(rows) == [{"id": "1"}, {"id": "2"}]
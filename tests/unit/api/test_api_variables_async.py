@@ -129,3 +129,13 @@ async def test_aget_variables_metadata_error(afetch_single_result: AsyncMock, va
     afetch_single_result.side_effect = _DummyException("fail")
     with pytest.raises(_DummyException):
         await variables_api.aget_variables_metadata()
+
+
+@pytest.mark.asyncio
+async def test_aiter_variables_streams_rows(monkeypatch: pytest.MonkeyPatch, variables_api: VariablesAPI) -> None:
+    async def fake(endpoint: str, **kwargs: object) -> object:
+        yield {"results": [{"id": "1"}]}
+        yield {"results": [{"id": "2"}]}
+
+    monkeypatch.setattr(variables_api, "_paginated_request_async", fake)
+    assert [row async for row in variables_api.aiter_variables(subject_id="P1")] == [{"id": "1"}, {"id": "2"}]
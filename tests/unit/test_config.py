@@ -52,6 +52,52 @@ def test_explicit_values_override_environment(monkeypatch: MonkeyPatch) -> None:
     assert config.page_size == 25
 
 
+@pytest.mark.unit
+def test_page_concurrency_from_environment(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("BDL_PAGE_CONCURRENCY", "8")
+
+    assert BDLConfig(api_key="abc123").page_concurrency == 8
+    assert BDLConfig(api_key="abc123", page_concurrency=2).page_concurrency == 2
+
+
+@pytest.mark.unit
+def test_connection_pool_limits_from_environment(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("BDL_MAX_CONNECTIONS", "64")
+    monkeypatch.setenv("BDL_MAX_KEEPALIVE_CONNECTIONS", "32")
+
+    config = BDLConfig(api_key="abc123")
+
+    assert config.max_connections == 64
+    assert config.max_keepalive_connections == 32
+
+
+@pytest.mark.unit
+def test_conditional_cache_size_from_environment(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("BDL_CONDITIONAL_CACHE_SIZE", "0")
+
+    assert BDLConfig(api_key="abc123").conditional_cache_size == 0
+    assert BDLConfig(api_key="abc123", conditional_cache_size=512).conditional_cache_size == 512
+
+
+@pytest.mark.unit
+def test_metadata_cache_ttl_from_environment(monkeypatch: MonkeyPatch) -> None:
+    assert BDLConfig(api_key="abc123").metadata_cache_ttl == 900.0
+
+    monkeypatch.setenv("BDL_METADATA_CACHE_TTL", "0")
+
+    assert BDLConfig(api_key="abc123").metadata_cache_ttl == 0.0
+    assert BDLConfig(api_key="abc123", metadata_cache_ttl=60).metadata_cache_ttl == 60.0
+
+
+@pytest.mark.unit
+def test_unit_batch_window_from_environment(monkeypatch: MonkeyPatch) -> None:
+    assert BDLConfig(api_key="abc123").unit_batch_window == 0.0
+
+    monkeypatch.setenv("BDL_UNIT_BATCH_WINDOW", "0.01")
+
+    assert BDLConfig(api_key="abc123").unit_batch_window == 0.01
+
+
 @pytest.mark.unit
 def test_retry_config_from_environment(monkeypatch: MonkeyPatch) -> None:
     monkeypatch.setenv("BDL_REQUEST_RETRIES", "5")
@@ -279,6 +325,12 @@ def test_config_anonymous_access_custom_quotas(monkeypatch: MonkeyPatch) -> None
     [
         ({"page_size": 0}, "page_size must be a positive integer"),
         ({"page_size": -1}, "page_size must be a positive integer"),
+        ({"page_concurrency": 0}, "page_concurrency must be a positive integer"),
+        ({"max_connections": 0}, "max_connections must be a positive integer"),
+        ({"max_keepalive_connections": -1}, "max_keepalive_connections must be greater than or equal to 0"),
+        ({"conditional_cache_size": -1}, "conditional_cache_size must be greater than or equal to 0"),
+        ({"metadata_cache_ttl": -1}, "metadata_cache_ttl must be greater than or equal to 0"),
+        ({"unit_batch_window": -1}, "unit_batch_window must be greater than or equal to 0"),
         ({"cache_expire_after": -1}, "cache_expire_after must be greater than or equal to 0"),
         ({"request_retries": -1}, "request_retries must be greater than or equal to 0"),
         ({"retry_backoff_factor": -0.1}, "retry_backoff_factor must be greater than or equal to 0"),
@@ -4,6 +4,8 @@ from collections.abc import Generator
 
 import pytest
 
+from pybdl.utils.rate_limiter import _decorators
+
 
 @pytest.fixture(autouse=True)
 def _enable_real_rate_limiting(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
@@ -11,3 +13,11 @@ def _enable_real_rate_limiting(monkeypatch: pytest.MonkeyPatch) -> Generator[Non
     # Undo the global patching from tests/api/conftest.py for this test module
     monkeypatch.undo()
     yield
+
+
+@pytest.fixture(autouse=True)
+def _fresh_decorator_limiters() -> Generator[None, None, None]:
+    """Give every test its own decorator limiters; the registry is process-wide."""
+    _decorators._limiters.clear()
+    yield
+    _decorators._limiters.clear()
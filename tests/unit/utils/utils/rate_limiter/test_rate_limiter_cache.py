@@ -3,6 +3,7 @@
 import multiprocessing
 import time
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -217,3 +218,87 @@ def test_async_rate_limiter_release_refunds_quota() -> None:
     import asyncio
 
     asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_rate_limiter_acquire_many_records_batch() -> None:
+    rl = rate_limiter.RateLimiter({1: 3}, is_registered=False)
+
+    reservations = rl.acquire_many(2)
+
+    assert len(reservations) == 2
+    assert rl.get_remaining_quota()[1] == 1
+    with pytest.raises(rate_limiter.BDLRateLimitError):
+        rl.acquire_many(2)
+    rl.release(reservations[0])
+    assert rl.get_remaining_quota()[1] == 2
+
+
+@pytest.mark.unit
+def test_rate_limiter_acquire_many_rejects_batch_above_quota() -> None:
+    rl = rate_limiter.RateLimiter({1: 3, 60: 2}, is_registered=False)
+
+    assert rl.max_batch_size == 2
+    with pytest.raises(ValueError, match="tightest quota allows 2"):
+        rl.acquire_many(3)
+    with pytest.raises(ValueError, match="positive integer"):
+        rl.acquire_many(0)
+
+
+@pytest.mark.unit
+def test_rate_limiter_acquire_many_writes_cache_once(tmp_path: Any) -> None:
+    cache = rate_limiter.PersistentQuotaCache(enabled=True, cache_file=tmp_path / "quota_cache.json")
+    rl = rate_limiter.RateLimiter({1: 5}, is_registered=False, cache=cache)
+
+    with patch.object(cache, "_save_unlocked", wraps=cache._save_unlocked) as save:
+        rl.acquire_many(4)
+
+    assert save.call_count == 1
+    assert len(cache.get_valid_timestamps("anon_1", time.time(), 1)) == 4
+
+
+@pytest.mark.unit
+def test_async_rate_limiter_acquire_many_records_batch() -> None:
+    arl = rate_limiter.AsyncRateLimiter({1: 3}, is_registered=False)
+
+    async def run() -> None:
+        reservations = await arl.acquire_many(3)
+        assert len(reservations) == 3
+        assert (await arl.get_remaining_quota_async())[1] == 0
+        with pytest.raises(rate_limiter.BDLRateLimitError):
+            await arl.acquire()
+
+    import asyncio
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_shared_quota_cache_is_reused_per_file(tmp_path: Any) -> None:
+    first = rate_limiter.PersistentQuotaCache.shared(True, cache_file=tmp_path / "shared.json")
+    second = rate_limiter.PersistentQuotaCache.shared(True, cache_file=str(tmp_path / "shared.json"))
+    other = rate_limiter.PersistentQuotaCache.shared(True, cache_file=tmp_path / "other.json")
+
+    assert first is second
+    assert other is not first
+    assert rate_limiter.PersistentQuotaCache.shared(False) is not rate_limiter.PersistentQuotaCache.shared(False)
+
+
+@pytest.mark.unit
+def test_shared_quota_cache_is_created_once_under_contention(tmp_path: Any) -> None:
+    import threading
+
+    barrier = threading.Barrier(8)
+    instances: list[rate_limiter.PersistentQuotaCache] = []
+
+    def worker() -> None:
+        barrier.wait()
+        instances.append(rate_limiter.PersistentQuotaCache.shared(True, cache_file=tmp_path / "contended.json"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(instance) for instance in instances}) == 1
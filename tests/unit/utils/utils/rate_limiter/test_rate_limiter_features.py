@@ -161,6 +161,29 @@ def test_async_rate_limit_decorator() -> None:
     asyncio.run(run())
 
 
+@pytest.mark.unit
+def test_rate_limit_decorators_with_same_settings_share_quota() -> None:
+    from pybdl.utils.rate_limiter import rate_limit
+
+    @rate_limit(quotas={1: 2}, is_registered=False)
+    def list_things() -> str:
+        return "list"
+
+    @rate_limit(quotas={1: 2}, is_registered=False)
+    def get_thing() -> str:
+        return "get"
+
+    @rate_limit(quotas={1: 2}, is_registered=True)
+    def registered_call() -> str:
+        return "registered"
+
+    assert list_things() == "list"
+    assert get_thing() == "get"
+    with pytest.raises(BDLRateLimitError):
+        list_things()
+    assert registered_call() == "registered"
+
+
 @pytest.mark.unit
 def test_decorator_preserves_function_metadata() -> None:
     """Test that decorators preserve function metadata."""
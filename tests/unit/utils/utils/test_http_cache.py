@@ -5,6 +5,8 @@ import pytest
 from hishel.httpx import AsyncCacheClient, SyncCacheClient
 
 from pybdl.utils.http_cache import (
+    ConditionalRequestCache,
+    DecodedResponseCache,
     build_async_http_client,
     build_sync_http_client,
     is_from_http_cache,
@@ -52,6 +54,10 @@ def test_build_sync_http_client_memory() -> None:
     )
     try:
         assert isinstance(client, SyncCacheClient)
+        assert client.storage is not None
+        connection = client.storage.connection  # type: ignore[attr-defined]
+        # An empty file name means SQLite keeps the database in memory.
+        assert connection.execute("PRAGMA database_list").fetchone()[2] == ""
     finally:
         client.close()
 
@@ -160,3 +166,91 @@ def test_is_from_http_cache_missing_extension() -> None:
     req = httpx.Request("GET", "https://example.test/")
     response = httpx.Response(200, request=req)
     assert is_from_http_cache(response) is False
+
+
+@pytest.mark.unit
+def test_http2_available_follows_h2_install(monkeypatch: pytest.MonkeyPatch) -> None:
+    from pybdl.utils.http_cache import client_factory
+
+    monkeypatch.setattr(client_factory, "find_spec", lambda name: None)
+    assert client_factory.http2_available() is False
+
+    monkeypatch.setattr(client_factory, "find_spec", lambda name: object() if name == "h2" else None)
+    assert client_factory.http2_available() is True
+
+
+def _cached_response(url: str, created_at: float, *, from_cache: bool = True) -> httpx.Response:
+    return httpx.Response(
+        200,
+        request=httpx.Request("GET", url),
+        extensions={"hishel_from_cache": from_cache, "hishel_created_at": created_at},
+    )
+
+
+@pytest.mark.unit
+def test_decoded_response_cache_keys_on_cache_entry() -> None:
+    cache = DecodedResponseCache()
+    payload = {"results": [1]}
+    cache.put(_cached_response("https://example.test/a", 1.0), payload)
+
+    assert cache.get(_cached_response("https://example.test/a", 1.0)) is payload
+    # A refreshed cache entry for the same URL must be decoded again.
+    assert cache.get(_cached_response("https://example.test/a", 2.0)) is None
+    assert cache.get(_cached_response("https://example.test/b", 1.0)) is None
+
+
+@pytest.mark.unit
+def test_decoded_response_cache_ignores_network_responses() -> None:
+    cache = DecodedResponseCache()
+    miss = _cached_response("https://example.test/a", 1.0, from_cache=False)
+    cache.put(miss, {"results": []})
+    assert cache.get(miss) is None
+
+
+@pytest.mark.unit
+def test_decoded_response_cache_evicts_least_recently_used() -> None:
+    cache = DecodedResponseCache(maxsize=2)
+    for index in range(3):
+        cache.put(_cached_response(f"https://example.test/{index}", 1.0), {"index": index})
+
+    assert cache.get(_cached_response("https://example.test/0", 1.0)) is None
+    assert cache.get(_cached_response("https://example.test/2", 1.0)) == {"index": 2}
+
+
+def _validated_response(url: str, status_code: int = 200, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", url))
+
+
+@pytest.mark.unit
+def test_conditional_request_cache_round_trip() -> None:
+    cache = ConditionalRequestCache()
+    payload = {"results": [1]}
+    cache.put(_validated_response("https://example.test/a", headers={"ETag": '"v1"'}), payload)
+
+    assert cache.validators("https://example.test/a") == {"If-None-Match": '"v1"'}
+    assert cache.get(_validated_response("https://example.test/a", 304)) is payload
+    assert cache.validators("https://example.test/b") == {}
+
+
+@pytest.mark.unit
+def test_conditional_request_cache_ignores_query_parameter_order() -> None:
+    cache = ConditionalRequestCache()
+    payload = {"results": [1]}
+    cache.put(_validated_response("https://example.test/a?page=1&lang=en", headers={"ETag": '"v1"'}), payload)
+
+    assert cache.validators("https://example.test/a?lang=en&page=1") == {"If-None-Match": '"v1"'}
+    assert cache.get(_validated_response("https://example.test/a?lang=en&page=1", 304)) is payload
+    assert cache.validators("https://example.test/a?lang=pl&page=1") == {}
+
+
+@pytest.mark.unit
+def test_conditional_request_cache_skips_responses_without_validators() -> None:
+    cache = ConditionalRequestCache()
+    cache.put(_validated_response("https://example.test/a"), {"results": []})
+    cache.put(
+        _validated_response("https://example.test/b", headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+        {"results": []},
+    )
+
+    assert cache.validators("https://example.test/a") == {}
+    assert cache.validators("https://example.test/b") == {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
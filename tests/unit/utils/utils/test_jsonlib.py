@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from pybdl.utils import jsonlib
+
+
+@pytest.mark.unit
+def test_loads_decodes_bytes_and_text() -> None:
+    assert jsonlib.loads(b'{"results": [1, 2]}') == {"results": [1, 2]}
+    assert jsonlib.loads('{"name": "Łódź"}') == {"name": "Łódź"}
+
+
+@pytest.mark.unit
+def test_loads_raises_value_error_on_malformed_input() -> None:
+    with pytest.raises(ValueError):
+        jsonlib.loads(b"not json")
+
+
+@pytest.mark.unit
+def test_loads_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(jsonlib, "orjson", None)
+    assert jsonlib.loads(b'{"id": 1}') == {"id": 1}
+    with pytest.raises(json.JSONDecodeError):
+        jsonlib.loads(b"{")
+
+
+@pytest.mark.unit
+def test_dumps_round_trips_with_either_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = {"reg_1": [1.5, 2.25], "name": "Łódź"}
+    encoded = jsonlib.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert jsonlib.loads(encoded) == data
+
+    monkeypatch.setattr(jsonlib, "orjson", None)
+    assert jsonlib.dumps(data) == encoded